@@ -4,55 +4,75 @@ from .budget_analyst import BudgetAnalyst
 from .policy_analyst import PolicyAnalyst
 from .underwriter import Underwriter
 
-try:
-    from .crew_agents import (
-        create_budget_analyst_agent,
-        create_policy_analyst_agent,
-        create_underwriter_agent,
-        analyze_with_crewai_budget_analyst,
-        analyze_with_crewai_policy_analyst,
-        analyze_with_crewai_underwriter,
-        CREWAI_AVAILABLE,
-    )
-    from .production_crew import (
-        create_production_crew,
-        run_production_crew,
-    )
-    from .shared_state import (
-        SharedStateManager,
-        AgentState,
-        LANGGRAPH_AVAILABLE,
-    )
-    __all__ = [
-        "BudgetAnalyst",
-        "PolicyAnalyst",
-        "Underwriter",
-        "create_budget_analyst_agent",
-        "create_policy_analyst_agent",
-        "create_underwriter_agent",
-        "analyze_with_crewai_budget_analyst",
-        "analyze_with_crewai_policy_analyst",
-        "analyze_with_crewai_underwriter",
-        "create_production_crew",
-        "run_production_crew",
-        "SharedStateManager",
-        "AgentState",
-        "CREWAI_AVAILABLE",
-        "LANGGRAPH_AVAILABLE",
-    ]
-except ImportError:
-    CREWAI_AVAILABLE = False
-    LANGGRAPH_AVAILABLE = False
-    try:
-        from .shared_state import SharedStateManager, AgentState
-        __all__ = [
-            "BudgetAnalyst",
-            "PolicyAnalyst",
-            "Underwriter",
-            "SharedStateManager",
-            "AgentState",
-            "CREWAI_AVAILABLE",
-            "LANGGRAPH_AVAILABLE",
-        ]
-    except ImportError:
-        __all__ = ["BudgetAnalyst", "PolicyAnalyst", "Underwriter", "CREWAI_AVAILABLE"]
+# The optional-dependency submodules guard their own imports (find_spec /
+# try-except at definition site) and always import cleanly, so no nested
+# try/except fallback is needed here: one import pass, no ImportError
+# stack-unwinding on cold start when crewai/langgraph are absent.
+from .crew_agents import (
+    create_budget_analyst_agent,
+    create_policy_analyst_agent,
+    create_underwriter_agent,
+    analyze_with_crewai_budget_analyst,
+    analyze_with_crewai_policy_analyst,
+    analyze_with_crewai_underwriter,
+    aanalyze_with_crewai_budget_analyst,
+    aanalyze_with_crewai_policy_analyst,
+    aanalyze_with_crewai_underwriter,
+    aanalyze_with_crewai,
+    analyze_with_crewai,
+    aanalyze_with_crewai_combined,
+    analyze_with_crewai_combined,
+    aanalyze_many_with_crewai,
+    analyze_many_with_crewai,
+    CREWAI_AVAILABLE,
+)
+from .production_crew import (
+    create_production_crew,
+    run_production_crew,
+    arun_production_crew,
+    run_production_crews,
+    arun_production_crews,
+)
+from .shared_state import (
+    SharedStateManager,
+    AgentState,
+    LANGGRAPH_AVAILABLE,
+)
+
+_DETERMINISTIC_EXPORTS = [
+    "BudgetAnalyst",
+    "PolicyAnalyst",
+    "Underwriter",
+]
+
+_CREWAI_EXPORTS = [
+    "create_budget_analyst_agent",
+    "create_policy_analyst_agent",
+    "create_underwriter_agent",
+    "analyze_with_crewai_budget_analyst",
+    "analyze_with_crewai_policy_analyst",
+    "analyze_with_crewai_underwriter",
+    "aanalyze_with_crewai_budget_analyst",
+    "aanalyze_with_crewai_policy_analyst",
+    "aanalyze_with_crewai_underwriter",
+    "aanalyze_with_crewai",
+    "analyze_with_crewai",
+    "aanalyze_with_crewai_combined",
+    "analyze_with_crewai_combined",
+    "aanalyze_many_with_crewai",
+    "analyze_many_with_crewai",
+    "create_production_crew",
+    "run_production_crew",
+    "arun_production_crew",
+    "run_production_crews",
+    "arun_production_crews",
+    "CREWAI_AVAILABLE",
+]
+
+_SHARED_STATE_EXPORTS = [
+    "SharedStateManager",
+    "AgentState",
+    "LANGGRAPH_AVAILABLE",
+]
+
+__all__ = _DETERMINISTIC_EXPORTS + _CREWAI_EXPORTS + _SHARED_STATE_EXPORTS
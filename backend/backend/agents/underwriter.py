@@ -1,5 +1,6 @@
 """Underwriter agent - evaluates development feasibility"""
-from typing import List, Literal
+from typing import List, Literal, Optional, Sequence, Tuple
+from backend.agents.fact_index import FactIndex
 from backend.models.extracted_fact import ExtractedFact, FactType
 from backend.models.agent_outputs import (
     BudgetAnalystOutput,
@@ -8,6 +9,87 @@ from backend.models.agent_outputs import (
 )
 from backend.models.citation import Citation
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+# Component weights for the feasibility score: funding, zoning, momentum
+_WEIGHTS = (0.4, 0.3, 0.3)
+
+_VARIANT_BY_VERDICT = {"go": "A", "caution": "B", "avoid": "C", "unknown": "unknown"}
+
+
+def _verdict_for_score(score: float) -> str:
+    """Map a feasibility score to a verdict"""
+    if score >= 70:
+        return "go"
+    if score >= 50:
+        return "caution"
+    return "avoid"
+
+
+def score_feasibility_batch(
+    funding: Sequence[Optional[float]],
+    zoning: Sequence[Optional[float]],
+    momentum: Sequence[Optional[float]],
+) -> Tuple[List[Optional[int]], List[str], List[str]]:
+    """
+    Score feasibility for many regions in one pass
+
+    The batched crew driver otherwise pays Python dispatch (list build,
+    if/elif chains) per region; with numpy installed the weighted sum and
+    both threshold maps run as a handful of C-level array ops. Missing
+    components are passed as None (or NaN) and contribute nothing, like
+    the single-region path; a region with all three missing scores None
+    with verdict "unknown".
+
+    Args:
+        funding: Per-region funding strength scores (None if missing)
+        zoning: Per-region zoning flexibility scores (None if missing)
+        momentum: Per-region proposal momentum scores (None if missing)
+
+    Returns:
+        Parallel lists of (feasibility_score, verdict, plan_variant)
+    """
+    if NUMPY_AVAILABLE:
+        f = np.array(funding, dtype=float)
+        z = np.array(zoning, dtype=float)
+        m = np.array(momentum, dtype=float)
+        weighted = (
+            np.nan_to_num(_WEIGHTS[0] * f)
+            + np.nan_to_num(_WEIGHTS[1] * z)
+            + np.nan_to_num(_WEIGHTS[2] * m)
+        )
+        missing = np.isnan(f) & np.isnan(z) & np.isnan(m)
+        conds = [missing, weighted >= 70, weighted >= 50]
+        verdicts = np.select(conds, ["unknown", "go", "caution"], default="avoid")
+        variants = np.select(conds, ["unknown", "A", "B"], default="C")
+        scores = [None if skip else int(s) for s, skip in zip(weighted, missing)]
+        return scores, verdicts.tolist(), variants.tolist()
+
+    scores = []
+    verdicts = []
+    variants = []
+    for components in zip(funding, zoning, momentum):
+        present = [
+            w * c
+            for w, c in zip(_WEIGHTS, components)
+            if c is not None and c == c  # NaN-safe, matches the numpy path
+        ]
+        if present:
+            score: Optional[int] = int(sum(present))
+            verdict = _verdict_for_score(score)
+        else:
+            score = None
+            verdict = "unknown"
+        scores.append(score)
+        verdicts.append(verdict)
+        variants.append(_VARIANT_BY_VERDICT[verdict])
+    return scores, verdicts, variants
+
 
 class Underwriter:
     """Evaluates feasibility based on budget, policy, and demographic facts"""
@@ -17,154 +99,124 @@ class Underwriter:
         budget_output: BudgetAnalystOutput,
         policy_output: PolicyAnalystOutput,
         facts: List[ExtractedFact],
-        citations: List[Citation]
+        citations: List[Citation],
+        fact_index: Optional[FactIndex] = None,
     ) -> UnderwriterOutput:
         """
         Analyze all inputs and produce underwriter verdict
-        
+
         Args:
             budget_output: Budget analysis output
             policy_output: Policy analysis output
             facts: All extracted facts
             citations: List of citations
-        
+            fact_index: Pre-built per-type index over facts; pass one when
+                the caller already indexed the region to skip the rebuild
+
         Returns:
             UnderwriterOutput with verdict, pros, cons, constraints
         """
-        # Calculate feasibility score
+        # Calculate feasibility score with the shared weights/thresholds
         feasibility_score = None
-        score_components = []
-        
-        if budget_output.funding_strength_score is not None:
-            score_components.append(budget_output.funding_strength_score * 0.4)  # 40% weight
-        
-        if policy_output.zoning_flexibility_score is not None:
-            score_components.append(policy_output.zoning_flexibility_score * 0.3)  # 30% weight
-        
-        if policy_output.proposal_momentum_score is not None:
-            score_components.append(policy_output.proposal_momentum_score * 0.3)  # 30% weight
-        
+        score_components = [
+            weight * score
+            for weight, score in zip(
+                _WEIGHTS,
+                (
+                    budget_output.funding_strength_score,
+                    policy_output.zoning_flexibility_score,
+                    policy_output.proposal_momentum_score,
+                ),
+            )
+            if score is not None
+        ]
         if score_components:
             feasibility_score = int(sum(score_components))
-        
+
         verdict: Literal["go", "caution", "avoid", "unknown"] = "unknown"
-        
+
         if feasibility_score is not None:
-            if feasibility_score >= 70:
-                verdict = "go"
-            elif feasibility_score >= 50:
-                verdict = "caution"
-            else:
-                verdict = "avoid"
-        else:
-            if budget_output.evidence_count == 0 and policy_output.evidence_count == 0:
-                verdict = "unknown"
-            elif budget_output.evidence_count > 0 and policy_output.evidence_count == 0:
-                verdict = "caution"
-            else:
-                verdict = "caution"
-        
-        plan_variant: Literal["A", "B", "C", "unknown"] = "unknown"
-        if verdict == "go":
-            plan_variant = "A"
-        elif verdict == "caution":
-            plan_variant = "B"
-        elif verdict == "avoid":
-            plan_variant = "C"
-        
+            verdict = _verdict_for_score(feasibility_score)
+        elif budget_output.evidence_count > 0 or policy_output.evidence_count > 0:
+            verdict = "caution"
+
+        plan_variant: Literal["A", "B", "C", "unknown"] = _VARIANT_BY_VERDICT[verdict]
+
         pros = []
         cons = []
         constraints = []
         
-        used_citation_ids = set()
-        used_fact_ids = set()
-        
+        # Fact types that back at least one pro/con/constraint; their
+        # citation ids are unioned once at the return site instead of via
+        # repeated per-branch set.update calls
+        used_types = set()
+
+        # One pass over facts (or none, when the caller shares a region
+        # index): each branch below otherwise re-scanned the full list
+        # with its own comprehension
+        index = fact_index or FactIndex.from_facts(facts)
+
         if budget_output.funding_strength_score and budget_output.funding_strength_score >= 60:
-            budget_facts = [f for f in facts if f.fact_type == FactType.BUDGET and f.citation_ids]
-            if budget_facts:
-                fact_ids = [f.id for f in budget_facts]
-                cite_ids = []
-                for f in budget_facts:
-                    cite_ids.extend(f.citation_ids)
-                
+            fact_ids = index.fact_ids(FactType.BUDGET)
+            if fact_ids:
                 pros.append({
                     "description": f"Strong funding environment (score: {budget_output.funding_strength_score})",
                     "supporting_fact_ids": fact_ids,
-                    "citation_ids": list(set(cite_ids)),
+                    "citation_ids": index.unique_cite_ids(FactType.BUDGET),
                 })
-                used_fact_ids.update(fact_ids)
-                used_citation_ids.update(cite_ids)
-        
+                used_types.add(FactType.BUDGET)
+
         if policy_output.zoning_flexibility_score and policy_output.zoning_flexibility_score >= 60:
-            zoning_facts = [f for f in facts if f.fact_type == FactType.ZONING and f.citation_ids]
-            if zoning_facts:
-                fact_ids = [f.id for f in zoning_facts]
-                cite_ids = []
-                for f in zoning_facts:
-                    cite_ids.extend(f.citation_ids)
-                
+            fact_ids = index.fact_ids(FactType.ZONING)
+            if fact_ids:
                 pros.append({
                     "description": f"Flexible zoning regulations (score: {policy_output.zoning_flexibility_score})",
                     "supporting_fact_ids": fact_ids,
-                    "citation_ids": list(set(cite_ids)),
+                    "citation_ids": index.unique_cite_ids(FactType.ZONING),
                 })
-                used_fact_ids.update(fact_ids)
-                used_citation_ids.update(cite_ids)
-        
+                used_types.add(FactType.ZONING)
+
         if budget_output.funding_strength_score and budget_output.funding_strength_score < 40:
-            budget_facts = [f for f in facts if f.fact_type == FactType.BUDGET and f.citation_ids]
-            if budget_facts:
-                fact_ids = [f.id for f in budget_facts]
-                cite_ids = []
-                for f in budget_facts:
-                    cite_ids.extend(f.citation_ids)
-                
+            fact_ids = index.fact_ids(FactType.BUDGET)
+            if fact_ids:
                 cons.append({
                     "description": f"Limited funding availability (score: {budget_output.funding_strength_score})",
                     "supporting_fact_ids": fact_ids,
-                    "citation_ids": list(set(cite_ids)),
+                    "citation_ids": index.unique_cite_ids(FactType.BUDGET),
                 })
-                used_fact_ids.update(fact_ids)
-                used_citation_ids.update(cite_ids)
-        
+                used_types.add(FactType.BUDGET)
+
         if policy_output.approval_friction_factors:
-            proposal_facts = [f for f in facts if f.fact_type == FactType.PROPOSAL and f.citation_ids]
-            if proposal_facts:
-                fact_ids = [f.id for f in proposal_facts]
-                cite_ids = []
-                for f in proposal_facts:
-                    cite_ids.extend(f.citation_ids)
-                
+            fact_ids = index.fact_ids(FactType.PROPOSAL)
+            if fact_ids:
                 cons.append({
                     "description": "Approval friction: " + "; ".join(policy_output.approval_friction_factors),
                     "supporting_fact_ids": fact_ids,
-                    "citation_ids": list(set(cite_ids)),
+                    "citation_ids": index.unique_cite_ids(FactType.PROPOSAL),
                 })
-                used_fact_ids.update(fact_ids)
-                used_citation_ids.update(cite_ids)
-        
+                used_types.add(FactType.PROPOSAL)
+
         if policy_output.constraints:
-            zoning_facts = [f for f in facts if f.fact_type == FactType.ZONING and f.citation_ids]
-            if zoning_facts:
-                fact_ids = [f.id for f in zoning_facts]
-                cite_ids = []
-                for f in zoning_facts:
-                    cite_ids.extend(f.citation_ids)
-                
+            fact_ids = index.fact_ids(FactType.ZONING)
+            if fact_ids:
                 constraints.append({
                     "description": "; ".join(policy_output.constraints),
                     "supporting_fact_ids": fact_ids,
-                    "citation_ids": list(set(cite_ids)),
+                    "citation_ids": index.unique_cite_ids(FactType.ZONING),
                 })
-                used_fact_ids.update(fact_ids)
-                used_citation_ids.update(cite_ids)
+                used_types.add(FactType.ZONING)
         
         total_evidence = budget_output.evidence_count + policy_output.evidence_count
         confidence = min(total_evidence / 10.0, 1.0) if total_evidence > 0 else 0.0
         
-        used_citation_ids.update(budget_output.citation_ids)
-        used_citation_ids.update(policy_output.citation_ids)
-        
+        # Single C-level union over the used buckets plus both analyst
+        # outputs, replacing up to seven Python-level .update calls
+        used_citation_ids = set().union(
+            *(index.cite_ids(fact_type) for fact_type in used_types),
+            budget_output.citation_ids,
+            policy_output.citation_ids,
+        )
+
         return UnderwriterOutput(
             feasibility_score=feasibility_score,
             verdict=verdict,
@@ -1,6 +1,8 @@
 """Configuration management"""
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -16,7 +18,15 @@ class Settings(BaseSettings):
     scrape_max_pages_per_category: int = 50
     
     openai_api_key: Optional[str] = None
+    llm_model: str = "gpt-4o-mini"
     use_llm_mode: bool = False
+    combined_llm_mode: bool = False
+    crewai_concurrency: int = 8
+    max_parallel_agents: int = 2
+    max_parallel_crews: int = 10
+    openai_rpm: Optional[int] = None
+    response_cache_path: str = "data/response_cache.json"
+    response_cache_ttl_seconds: Optional[int] = None
     
     supabase_url: Optional[str] = None
     supabase_key: Optional[str] = None
@@ -24,7 +34,24 @@ class Settings(BaseSettings):
     
     api_host: str = "0.0.0.0"
     api_port: int = 8000
+    # Concrete origins (not "*"): required for credentialed CORS, and lets
+    # Starlette precompute the response headers instead of per-request
+    cors_allow_origins: List[str] = [
+        "http://localhost:3000",
+        "http://127.0.0.1:3000",
+    ]
     
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Process-wide Settings instance
+
+    Construction re-reads .env and runs pydantic coercion; one cached
+    instance serves every import site (API module, CLI, FastAPI
+    Depends(get_settings)).
+    """
+    return Settings()
@@ -1,22 +1,284 @@
 """Structured fact extraction from scraped documents"""
+import hashlib
+import logging
+import mmap
+import os
+import pickle
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count, islice, repeat
 from pathlib import Path
 from typing import List, Optional, Dict, Any
-from bs4 import BeautifulSoup
-import pdfplumber
+
+# pdfplumber (pdfminer.six, Pillow, cryptography) and lxml are imported
+# inside the methods that need them so an API instance that only ever
+# sees HTML never pays the PDF stack's tens of MB of import-time memory.
+# sys.modules makes repeat imports free.
+
+# selectolax (lexbor engine) strips HTML to text in one C pass, several
+# times faster and far lighter than building a full lxml tree just to
+# call text_content(). Guarded like the other optional C extensions;
+# lxml stays for the fallback and for XML feeds.
+try:
+    from selectolax.parser import HTMLParser
+
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# pyahocorasick sweeps a whole keyword set over the text in one C pass
+# (a DFA over the keywords) instead of one substring scan per keyword;
+# it reports overlapping keywords ("condo" inside "condominium") just
+# like the per-keyword scans do
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# orjson parses API JSON payloads in one Rust pass, several times faster
+# than the stdlib decoder on multi-MB responses. Guarded like the other
+# optional C extensions.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    _json_loads = json.loads
 
 from backend.models.discovered_source import DiscoveredSource, SourceCategory, DocumentType
 from backend.models.extracted_fact import ExtractedFact, FactType
 from backend.models.citation import Citation
 from backend.config import Settings
 
+logger = logging.getLogger(__name__)
+
+# Facts are built with ExtractedFact.model_construct throughout: every
+# call site passes already-typed values from this trusted pipeline, and
+# model_construct skips pydantic validation while still applying the
+# model's defaults (extracted_at and friends). External/untrusted data
+# must keep going through ExtractedFact(...).
+
+# Patterns and keyword lists compiled/built once at import. The extractors
+# run per document, and re-passing pattern strings into re.finditer pays a
+# regex-cache probe plus a fresh list allocation on every call. Keyword
+# sequences stay ordered tuples: iteration order fixes fact ids.
+
+# The three amount patterns and the year pattern fused into one
+# alternation: one linear scan of the document instead of four, and the
+# leading "big" alternative consumes "$45 million" whole so the bare
+# "$45" alternative no longer re-reports the same span. lastgroup names
+# which alternative fired.
+_BUDGET_UNION = re.compile(
+    r'(?P<big>\$[\d.,]+\s*(?:billion|million|B|M|k|thousand))'
+    r'|(?P<dollar>\$[\d,]+)'
+    r'|(?P<cad>[\d,]+\s*(?:CAD|USD|dollars?))'
+    r'|(?P<year>20\d{2}|FY\s*\d{4})',
+    re.IGNORECASE,
+)
+
+# Zoning patterns fused the same way: codes (e.g., R-1, C-2, RS-1) plus
+# districts, heights, densities, coverage, setbacks, bylaws and parking
+# in one alternation, so each document is scanned once instead of ~15
+# times. Only the code alternative is case-sensitive, and it is anchored
+# to the zoning prefix alphabet (longest prefixes first) rather than any
+# letters-digits pair, which used to claim acronyms like "COVID-19" or
+# proposal ids like "DP-2024". The rest carry a scoped (?i:) flag. The
+# first alternative to claim a span wins, so text like "FSR 2.5" yields
+# one fact where the separate passes yielded two.
+_ZONING_UNION = re.compile(
+    r'(?P<code>\b(?:RS|RM|CD|FM|AG|R|C|M|I|A|P)-?\d{1,3}[A-Z]?\b)'
+    r'|(?P<district>(?i:'
+    r'(?:downtown|north shore|south shore|city centre|transit.oriented|neighbourhood)\s*(?:plan|area|district|zone)?'
+    r'|(?:single.family|multi.family|multi.unit|duplex|triplex|fourplex|townhouse)\s*(?:residential|zone|district)?'
+    r'|(?:low|medium|high)\s*density\s*(?:residential|zone|area)?))'
+    r'|(?P<height>(?i:'
+    r'\d+(?:\.\d+)?\s*(?:metre|meter|m)\s*(?:height|tall|maximum)?'
+    r'|\d+\s*(?:storey|story|stories|floors?)\s*(?:height|maximum|building)?'
+    r'|(?:height|maximum)\s*(?:of|:)?\s*\d+(?:\.\d+)?\s*(?:m|metres?|feet|ft)?))'
+    r'|(?P<density>(?i:'
+    r'(?:fsr|floor\s*space\s*ratio)\s*(?:of|:)?\s*\d+(?:\.\d+)?'
+    r'|\d+(?:\.\d+)?\s*(?:fsr|floor\s*space\s*ratio)'
+    r'|density\s*(?:of|:)?\s*\d+(?:\.\d+)?\s*(?:units?|dwelling|per)'
+    r'|\d+\s*(?:units?|dwellings?)\s*per\s*(?:hectare|acre|ha)))'
+    r'|(?P<coverage>(?i:'
+    r'(?:lot\s*coverage|site\s*coverage|building\s*coverage)\s*(?:of|:)?\s*\d+(?:\.\d+)?\s*%?'
+    r'|\d+(?:\.\d+)?\s*%?\s*(?:lot\s*coverage|site\s*coverage|maximum\s*coverage)))'
+    r'|(?P<setback>(?i:'
+    r'(?:front|rear|side|setback)\s*(?:yard|setback)?\s*(?:of|:)?\s*\d+(?:\.\d+)?\s*(?:m|metres?|feet|ft)?'
+    r'|\d+(?:\.\d+)?\s*(?:m|metres?|feet|ft)\s*(?:front|rear|side)\s*(?:yard|setback)?))'
+    r'|(?P<bylaw>(?i:'
+    r'(?:bylaw|by-law)\s*(?:no\.?|#)?\s*\d+'
+    r'|(?:zoning\s*bylaw|land\s*use\s*bylaw)\s*(?:no\.?|#)?\s*(?:\d+)?))'
+    r'|(?P<parking>(?i:'
+    r'\d+(?:\.\d+)?\s*(?:parking\s*)?(?:stalls?|spaces?)\s*(?:per|/)\s*(?:unit|dwelling|sq\.?\s*(?:m|ft|metre|foot))'
+    r'|(?:parking|stalls?|spaces?)\s*(?:requirement|required|minimum)\s*(?:of|:)?\s*\d+(?:\.\d+)?))'
+)
+
+# Per-group fact-id token, fact key and fixed unit for the zoning union;
+# the height unit depends on the matched text and is resolved in the loop
+_ZONING_GROUP_META = {
+    "code": ("zoning", "zoning_code", None),
+    "district": ("zoning_district", "zoning_district", None),
+    "height": ("zoning_height", "height_restriction", None),
+    "density": ("zoning_density", "density_regulation", None),
+    "coverage": ("zoning_coverage", "lot_coverage", "percent"),
+    "setback": ("zoning_setback", "setback_requirement", None),
+    "bylaw": ("zoning_bylaw", "bylaw_reference", None),
+    "parking": ("zoning_parking", "parking_requirement", None),
+}
+_LAND_USE_KEYWORDS = (
+    "residential", "commercial", "industrial", "mixed-use", "mixed use",
+    "agricultural", "institutional", "recreational", "open space",
+    "transit-oriented", "transit oriented", "high density", "low density",
+    "medium density", "multi-family", "single-family", "multi-unit",
+    "small-scale", "small scale", "infill", "intensification",
+)
+
+# Proposal patterns, fused like the zoning union. Id prefixes: DP
+# (Development Permit), DA (Development Application), DVP (Development
+# Variance Permit), REZ (Rezoning), SUB (Subdivision), OCP (Official
+# Community Plan amendment), BP (Building Permit)
+_PROPOSAL_UNION = re.compile(
+    r'(?P<pid>(?:application|proposal)\s*#?\s*[A-Z0-9-]+'
+    r'|(?:DP|DA|DVP|REZ|SUB|OCP|BP)\s*[A-Z0-9-]+)'
+    r'|(?P<rate>'
+    r'\d+\s*(?:development\s*)?(?:permits?|applications?)\s*(?:issued|approved|submitted|received)'
+    r'|(?:issued|approved|submitted|received)\s*\d+\s*(?:development\s*)?(?:permits?|applications?)'
+    r'|\d+\s*(?:new|total)\s*(?:units?|dwellings?|homes?)\s*(?:approved|built|constructed|permitted)'
+    r'|(?:approval\s*rate|success\s*rate)\s*(?:of|:)?\s*\d+(?:\.\d+)?\s*%'
+    r'|\d+\s*(?:days?|weeks?|months?)\s*(?:processing|review|approval)\s*(?:time|period)?)'
+    r'|(?P<dcc>'
+    r'(?:development\s*cost\s*charge|dcc)\s*(?:of|:)?\s*\$?\d[\d,]*(?:\.\d+)?'
+    r'|\$?\d[\d,]*(?:\.\d+)?\s*(?:per\s*)?(?:development\s*cost\s*charge|dcc)'
+    r'|(?:amenity\s*contribution|community\s*amenity)\s*(?:of|:)?\s*\$?\d[\d,]*(?:\.\d+)?)'
+    r'|(?P<units>'
+    r'\d+\s*(?:residential\s*)?(?:units?|dwellings?|suites?|apartments?)'
+    r'|\d+\s*(?:bed|bedroom)\s*(?:units?|apartments?)?'
+    r'|\d+\s*(?:storeys?|stories?|floors?)\s*(?:building|tower|development)?)',
+    re.IGNORECASE,
+)
+_PROPOSAL_GROUP_META = {
+    "pid": ("proposal", "proposal_id", None),
+    "rate": ("proposal_rate", "development_rate", None),
+    "dcc": ("proposal_dcc", "development_cost_charge", "CAD"),
+    "units": ("proposal_units", "unit_count", None),
+}
+_INT_PREFIX_RE = re.compile(r'\d+')
+
+# Placeholder spliced into cached fact ids in place of the citation
+# scope, so a cache hit can be re-numbered for the current run
+_CACHE_DOC_TOKEN = "{DOC}"
+
+# Key fragments the JSON walkers look for in dict keys, as one
+# alternation each: a single scan of the key instead of up to six
+# substring probes per node (keys match partially, e.g. "total_budget")
+_BUDGET_JSON_KEY_RE = re.compile("budget|total|amount|funding|allocation|spending")
+_DEMO_JSON_KEY_RE = re.compile("population|demographics|growth|residents|people|count")
+_CURRENCY_TOKEN_RE = re.compile(r'cad|usd|dollar', re.IGNORECASE)
+_PERMIT_TYPES = (
+    "development permit", "building permit", "variance permit",
+    "rezoning", "subdivision", "sign permit", "demolition permit",
+    "plumbing permit", "electrical permit", "minor variance",
+    "ocp amendment", "community plan amendment",
+)
+_STATUS_KEYWORDS = (
+    "approved", "pending", "under review", "rejected", "withdrawn",
+    "in progress", "complete", "conditional approval",
+)
+_PROJECT_TYPES = (
+    "multi-family", "multi family", "single-family", "single family",
+    "townhouse", "apartment", "condo", "condominium", "mixed-use",
+    "commercial", "retail", "office", "industrial", "warehouse",
+    "affordable housing", "rental housing", "seniors housing",
+)
+
+_POPULATION_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'population\s*:?\s*([\d,]+)',
+    r'([\d,]+)\s*residents',
+    r'([\d,]+)\s*people',
+))
+_GROWTH_RE = re.compile(r'growth\s*(?:rate|of)?\s*:?\s*([\d.]+)%', re.IGNORECASE)
+_NUM_SEP_RE = re.compile(r'[,\s]')
+
+# Budget-value suffix multipliers, ordered so the long forms and "b" win
+# before "m" (the substring check means "billion" also contains no "m"
+# hazard, but "$1.2B" must not fall through to thousand/k)
+_BUDGET_MULTIPLIERS = (
+    ("billion", 1_000_000_000),
+    ("b", 1_000_000_000),
+    ("million", 1_000_000),
+    ("m", 1_000_000),
+    ("thousand", 1_000),
+    ("k", 1_000),
+)
+_NUM_RE = re.compile(r'[\d.,]+')
+
+_DEVELOPMENT_KEYWORDS = (
+    "development permit", "building permit", "variance permit",
+    "rezoning", "subdivision", "development application",
+    "permit application", "development proposal", "current applications",
+    "active development", "epermit", "e-permit",
+)
+# Fallback for the content check when pyahocorasick is absent: one
+# alternation search that exits at the first hit instead of a substring
+# scan per keyword (the input is pre-lowered, so no IGNORECASE needed)
+_DEV_CONTENT_RE = re.compile("|".join(map(re.escape, _DEVELOPMENT_KEYWORDS)))
+
+
+def _build_automaton(keywords: tuple):
+    """Compile a keyword tuple into an Aho-Corasick automaton"""
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+if AHOCORASICK_AVAILABLE:
+    _LAND_USE_AC = _build_automaton(_LAND_USE_KEYWORDS)
+    _PERMIT_AC = _build_automaton(_PERMIT_TYPES)
+    _STATUS_AC = _build_automaton(_STATUS_KEYWORDS)
+    _PROJECT_AC = _build_automaton(_PROJECT_TYPES)
+    _DEV_CONTENT_AC = _build_automaton(_DEVELOPMENT_KEYWORDS)
+else:
+    _LAND_USE_AC = _PERMIT_AC = _STATUS_AC = _PROJECT_AC = None
+    _DEV_CONTENT_AC = None
+
+
+def _match_keywords(lower_text: str, keywords: tuple, automaton=None) -> List[str]:
+    """Keywords present in pre-lowered text, in keyword-tuple order
+
+    The caller lowercases the document exactly once. With pyahocorasick
+    the whole set is found in a single sweep of the text (overlapping
+    keywords like "condo" inside "condominium" are still both reported);
+    without it, one C-level substring scan per keyword remains.
+    """
+    if automaton is not None:
+        found = {kw for _, kw in automaton.iter(lower_text)}
+        return [kw for kw in keywords if kw in found]
+    return [kw for kw in keywords if kw in lower_text]
+
 
 class FactExtractor:
     """Extracts structured facts from discovered sources"""
     
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.citation_counter = 0
+        self.citation_counter = count(1)
+        # Built once; Path construction per source adds up in the loop
+        self._data_dir = Path(settings.data_dir)
+        # One dispatch table for every document type's category branch;
+        # bound methods, so built per instance
+        self._by_category = {
+            SourceCategory.BUDGET: self._extract_budget_facts,
+            SourceCategory.ZONING: self._extract_zoning_facts,
+            SourceCategory.PROPOSALS: self._extract_proposal_facts,
+            SourceCategory.ANALYTICS: self._extract_demographic_facts,
+        }
     
     def extract_facts_from_sources(
         self,
@@ -29,22 +291,41 @@ class FactExtractor:
         Returns:
             Tuple of (citations, facts)
         """
-        citations: List[Citation] = []
         facts: List[ExtractedFact] = []
-        
-        for source in sources:
-            citation = self._create_citation(source)
-            citations.append(citation)
-            
-            source_facts = self._extract_from_source(source, region_id, citation.id)
-            facts.extend(source_facts)
-        
+
+        # Citation ids are assigned up front so their numbering does not
+        # depend on how the extraction work is scheduled
+        citations = [self._create_citation(source) for source in sources]
+
+        # PDF text extraction is the compute-bound phase of the pipeline,
+        # so sources fan out across a process pool; ex.map keeps results
+        # in source order, preserving fact ordering. A single source (or
+        # a single core) stays in-process to skip the spawn cost.
+        # Capped at 8: extraction is memory-bound past that and each
+        # worker re-imports the PDF stack
+        max_workers = min(len(sources), os.cpu_count() or 1, 8)
+        if max_workers <= 1:
+            for source, citation in zip(sources, citations):
+                facts.extend(
+                    self._extract_from_source(source, region_id, citation.id)
+                )
+            return citations, facts
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for source_facts in executor.map(
+                _extract_source_facts,
+                sources,
+                repeat(region_id),
+                [citation.id for citation in citations],
+                repeat(self.settings),
+            ):
+                facts.extend(source_facts)
+
         return citations, facts
     
     def _create_citation(self, source: DiscoveredSource) -> Citation:
         """Create a citation from a discovered source"""
-        self.citation_counter += 1
-        citation_id = f"cite_{self.citation_counter:04d}"
+        citation_id = f"cite_{next(self.citation_counter):04d}"
         
         return Citation(
             id=citation_id,
@@ -66,11 +347,24 @@ class FactExtractor:
         if source.file_path is None:
             return facts
         
-        file_path = Path(self.settings.data_dir) / source.file_path
-        
-        if not file_path.exists():
+        file_path = self._data_dir / source.file_path
+
+        if not file_path.is_file():
             return facts
-        
+
+        # Re-runs over an unchanged file reproduce the same facts, so a
+        # hit in the on-disk cache skips the parse entirely. Keyed on
+        # path, mtime, size, category and region; the citation scope is
+        # re-applied on load so hits follow this run's numbering.
+        try:
+            cache_path = self._fact_cache_path(source, region_id, file_path.stat())
+        except OSError:
+            cache_path = None
+        if cache_path is not None:
+            cached = self._load_cached_facts(cache_path, citation_id)
+            if cached is not None:
+                return cached
+
         try:
             if source.document_type == DocumentType.HTML:
                 facts = self._extract_from_html(source, region_id, citation_id, file_path)
@@ -80,10 +374,64 @@ class FactExtractor:
                 facts = self._extract_from_rss(source, region_id, citation_id, file_path)
             elif source.document_type == DocumentType.API:
                 facts = self._extract_from_api(source, region_id, citation_id, file_path)
-        except Exception as e:
-            print(f"Error extracting from {source.uri}: {e}")
-        
+        except Exception:
+            logger.exception("Error extracting from %s", source.uri)
+        else:
+            if cache_path is not None:
+                self._store_cached_facts(cache_path, facts, citation_id)
+
         return facts
+
+    def _fact_cache_path(self, source: DiscoveredSource, region_id: str, stat: os.stat_result) -> Path:
+        """Cache location for one source file's extracted facts"""
+        key = "|".join((
+            "v1",
+            str(source.file_path),
+            str(stat.st_mtime_ns),
+            str(stat.st_size),
+            source.category.value,
+            region_id,
+        ))
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return self._data_dir / ".fact_cache" / f"{digest}.pkl"
+
+    @staticmethod
+    def _load_cached_facts(cache_path: Path, citation_id: str) -> Optional[List[ExtractedFact]]:
+        """Rehydrate cached facts under the current citation id, or None"""
+        try:
+            with open(cache_path, "rb") as f:
+                rows = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.debug("Ignoring unreadable fact cache %s", cache_path)
+            return None
+        doc = "c" + citation_id.rsplit("_", 1)[-1]
+        facts = []
+        for row in rows:
+            row["id"] = row["id"].replace(_CACHE_DOC_TOKEN, doc, 1)
+            row["citation_ids"] = [citation_id]
+            facts.append(ExtractedFact.model_construct(**row))
+        return facts
+
+    @staticmethod
+    def _store_cached_facts(cache_path: Path, facts: List[ExtractedFact], citation_id: str) -> None:
+        """Write facts to the cache with the citation scope blanked out"""
+        doc = "c" + citation_id.rsplit("_", 1)[-1]
+        rows = []
+        for fact in facts:
+            row = fact.model_dump()
+            row["id"] = row["id"].replace(doc, _CACHE_DOC_TOKEN, 1)
+            row["citation_ids"] = []
+            rows.append(row)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_path.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(rows, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_path)
+        except OSError:
+            logger.debug("Could not write fact cache %s", cache_path)
     
     def _extract_from_html(
         self,
@@ -92,45 +440,53 @@ class FactExtractor:
         citation_id: str,
         file_path: Path
     ) -> List[ExtractedFact]:
-        """Extract facts from HTML document"""
+        """Extract facts from HTML document
+
+        The file is mmapped and fed to the parser as raw bytes; both
+        parsers detect the encoding themselves, so the read_text() decode
+        pass (a second full copy of multi-MB scrape dumps) is skipped.
+        """
         facts: List[ExtractedFact] = []
-        content = file_path.read_text(encoding="utf-8", errors="ignore")
-        soup = BeautifulSoup(content, "lxml")
-        text = soup.get_text()
-        
-        category_to_fact_type = {
-            SourceCategory.BUDGET: FactType.BUDGET,
-            SourceCategory.ZONING: FactType.ZONING,
-            SourceCategory.PROPOSALS: FactType.PROPOSAL,
-            SourceCategory.ANALYTICS: FactType.DEMOGRAPHIC,
-        }
-        
-        fact_type = category_to_fact_type.get(source.category, FactType.BUDGET)
-        
-        if source.category == SourceCategory.BUDGET:
-            facts.extend(self._extract_budget_facts(text, region_id, citation_id))
-        elif source.category == SourceCategory.ZONING:
-            facts.extend(self._extract_zoning_facts(text, region_id, citation_id))
-            # Also extract proposal facts if the page has development content
-            if self._has_development_content(text):
-                facts.extend(self._extract_proposal_facts(text, region_id, citation_id))
-        elif source.category == SourceCategory.PROPOSALS:
-            facts.extend(self._extract_proposal_facts(text, region_id, citation_id))
-        elif source.category == SourceCategory.ANALYTICS:
-            facts.extend(self._extract_demographic_facts(text, region_id, citation_id))
-        
+        with open(file_path, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped and have nothing to extract
+                return facts
+            with mm:
+                if SELECTOLAX_AVAILABLE:
+                    # selectolax insists on str/bytes, so one copy of the
+                    # raw bytes remains; still no decode scan
+                    text = HTMLParser(bytes(mm)).text(separator=" ")
+                else:
+                    from lxml import html as lxml_html
+                    text = lxml_html.fromstring(bytes(mm)).text_content()
+
+        # Markup-only pages (trackers, redirect shells) strip to nothing;
+        # no point running a dozen regexes over whitespace
+        if not text or text.isspace():
+            return facts
+
+        extract = self._by_category.get(source.category)
+        if extract:
+            facts.extend(extract(text, region_id, citation_id))
+        # Also extract proposal facts if the page has development content;
+        # one lowered copy serves the content check and the proposal scan
+        if source.category == SourceCategory.ZONING:
+            lower_text = text.lower()
+            if self._has_development_content(lower_text):
+                facts.extend(self._extract_proposal_facts(
+                    text, region_id, citation_id, lower_text=lower_text
+                ))
+
         return facts
-    
-    def _has_development_content(self, text: str) -> bool:
-        """Check if text contains development-related content"""
-        text_lower = text.lower()
-        development_keywords = [
-            "development permit", "building permit", "variance permit",
-            "rezoning", "subdivision", "development application",
-            "permit application", "development proposal", "current applications",
-            "active development", "epermit", "e-permit",
-        ]
-        return any(kw in text_lower for kw in development_keywords)
+
+    def _has_development_content(self, lower_text: str) -> bool:
+        """Check if pre-lowered text contains development-related content"""
+        if _DEV_CONTENT_AC is not None:
+            # Short-circuits on the first hit of the single DFA sweep
+            return next(_DEV_CONTENT_AC.iter(lower_text), None) is not None
+        return _DEV_CONTENT_RE.search(lower_text) is not None
     
     def _extract_from_pdf(
         self,
@@ -139,491 +495,337 @@ class FactExtractor:
         citation_id: str,
         file_path: Path
     ) -> List[ExtractedFact]:
-        """Extract facts from PDF document"""
+        """Extract facts from PDF document, one page at a time
+
+        Joining every page into a single string doubles peak memory on
+        large budget PDFs; scanning page-by-page keeps only one page's
+        text alive at once. Counter offsets keep fact ids unique across
+        the document's pages. Pages are deliberately not fanned out to a
+        thread pool: pdfplumber pages share parser state, MuPDF is fast
+        enough not to need it, and parallelism lives at the source level
+        in extract_facts_from_sources instead.
+        """
         facts: List[ExtractedFact] = []
-        
+
+        extract = self._by_category.get(source.category)
+        if extract is None:
+            return facts
+
+        offset = 0
+        proposal_offset = 0
         try:
-            with pdfplumber.open(str(file_path)) as pdf:
-                text = "\n".join(page.extract_text() or "" for page in pdf.pages)
-                
-                if source.category == SourceCategory.BUDGET:
-                    facts.extend(self._extract_budget_facts(text, region_id, citation_id))
-                elif source.category == SourceCategory.ZONING:
-                    facts.extend(self._extract_zoning_facts(text, region_id, citation_id))
-                    # Also extract proposal facts if the PDF has development content
-                    if self._has_development_content(text):
-                        facts.extend(self._extract_proposal_facts(text, region_id, citation_id))
-                elif source.category == SourceCategory.PROPOSALS:
-                    facts.extend(self._extract_proposal_facts(text, region_id, citation_id))
-                elif source.category == SourceCategory.ANALYTICS:
-                    facts.extend(self._extract_demographic_facts(text, region_id, citation_id))
-        except Exception as e:
-            print(f"Error reading PDF {file_path}: {e}")
-        
+            for page_text in self._iter_pdf_page_texts(file_path):
+                if not page_text:
+                    continue
+                page_facts = extract(
+                    page_text, region_id, citation_id, counter_start=offset
+                )
+                offset += len(page_facts)
+                facts.extend(page_facts)
+                # Also extract proposal facts from pages with
+                # development content; one lowered copy per page
+                if source.category == SourceCategory.ZONING:
+                    page_lower = page_text.lower()
+                    if self._has_development_content(page_lower):
+                        page_proposals = self._extract_proposal_facts(
+                            page_text,
+                            region_id,
+                            citation_id,
+                            counter_start=proposal_offset,
+                            lower_text=page_lower,
+                        )
+                        proposal_offset += len(page_proposals)
+                        facts.extend(page_proposals)
+        except Exception:
+            logger.exception("Error reading PDF %s", file_path)
+
         return facts
+
+    @staticmethod
+    def _iter_pdf_page_texts(file_path: Path):
+        """Yield each page's text, via PyMuPDF when it is installed
+
+        MuPDF extracts text through its C library, an order of magnitude
+        faster per page than the pure-Python pdfminer stack under
+        pdfplumber; this chunk only needs raw text, not pdfplumber's
+        table/layout machinery. Imports stay inside the method so the
+        PDF stack is only paid for when a PDF actually arrives.
+        """
+        try:
+            import pymupdf
+        except ImportError:
+            import pdfplumber
+            with pdfplumber.open(str(file_path)) as pdf:
+                for page in pdf.pages:
+                    yield page.extract_text() or ""
+            return
+        with pymupdf.open(str(file_path)) as pdf:
+            for page in pdf:
+                yield page.get_text()
     
     def _extract_budget_facts(
         self,
         text: str,
         region_id: str,
-        citation_id: str
+        citation_id: str,
+        counter_start: int = 0
     ) -> List[ExtractedFact]:
-        """Extract budget-related facts from text"""
+        """Extract budget-related facts from text
+
+        counter_start offsets the fact-id counter so page-by-page callers
+        keep ids unique across one document.
+        """
         facts: List[ExtractedFact] = []
-        fact_counter = 0
-        
-        budget_patterns = [
-            r'\$[\d.,]+\s*(?:billion|million|B|M|k|thousand)',
-            r'\$[\d,]+',
-            r'[\d,]+(?:\s+)?(?:CAD|USD|dollars?)',
-        ]
-        
-        for pattern in budget_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                fact_counter += 1
-                fact_id = f"fact_{region_id}_budget_{fact_counter:04d}"
-                
-                value_str = match.group(0)
-                value = self._parse_budget_value(value_str)
-                
-                facts.append(ExtractedFact(
-                    id=fact_id,
-                    region_id=region_id,
-                    fact_type=FactType.BUDGET,
-                    key=f"budget_mention_{fact_counter}",
-                    value=value_str,
-                    unit="CAD",
-                    citation_ids=[citation_id],
-                ))
-        
-        year_match = re.search(r'(?:20\d{2}|FY\s*\d{4})', text)
-        if year_match:
+        if not text:
+            return facts
+        fact_counter = counter_start
+        # Citation-number scope: keeps fact ids unique across sources
+        doc = "c" + citation_id.rsplit("_", 1)[-1]
+        id_prefix = f"fact_{region_id}_{doc}_"
+        # C-level pre-screen: a page with no currency marker (misfiled
+        # sources, mostly) has no amounts for the union to find, and a
+        # bare-year fact alone is not worth the full scan
+        if "$" not in text and _CURRENCY_TOKEN_RE.search(text) is None:
+            return facts
+        budget_year: Optional[str] = None
+
+        # Single scan over the text; amount mentions come out in document
+        # order and only the first year sighting is kept, as before
+        for match in _BUDGET_UNION.finditer(text):
+            value_str = match.group(0)
+            if match.lastgroup == "year":
+                if budget_year is None:
+                    budget_year = value_str
+                continue
+            fact_counter += 1
+            fact_id = id_prefix + f"budget_{fact_counter:04d}"
+
+            facts.append(ExtractedFact.model_construct(
+                id=fact_id,
+                region_id=region_id,
+                fact_type=FactType.BUDGET,
+                key=f"budget_mention_{fact_counter}",
+                value=value_str,
+                unit="CAD",
+                citation_ids=[citation_id],
+            ))
+
+        if budget_year is not None:
             fact_counter += 1
-            fact_id = f"fact_{region_id}_budget_year_{fact_counter:04d}"
-            facts.append(ExtractedFact(
+            fact_id = id_prefix + f"budget_year_{fact_counter:04d}"
+            facts.append(ExtractedFact.model_construct(
                 id=fact_id,
                 region_id=region_id,
                 fact_type=FactType.BUDGET,
                 key="budget_year",
-                value=year_match.group(0),
+                value=budget_year,
                 citation_ids=[citation_id],
             ))
-        
+
         return facts
     
     def _extract_zoning_facts(
         self,
         text: str,
         region_id: str,
-        citation_id: str
+        citation_id: str,
+        counter_start: int = 0
     ) -> List[ExtractedFact]:
-        """Extract zoning-related facts from text"""
+        """Extract zoning-related facts from text
+
+        counter_start offsets the fact-id counter so page-by-page callers
+        keep ids unique across one document.
+        """
         facts: List[ExtractedFact] = []
-        fact_counter = 0
-        
-        # Zoning code patterns (e.g., R-1, C-2, M-1, RS-1, RM-3)
-        zoning_pattern = r'\b[A-Z]{1,3}[- ]?\d+[A-Z]?\b'
-        matches = re.finditer(zoning_pattern, text)
-        seen_codes = set()
-        
-        for match in matches:
-            code = match.group(0)
-            if code not in seen_codes:
-                seen_codes.add(code)
-                fact_counter += 1
-                fact_id = f"fact_{region_id}_zoning_{fact_counter:04d}"
-                
-                facts.append(ExtractedFact(
-                    id=fact_id,
-                    region_id=region_id,
-                    fact_type=FactType.ZONING,
-                    key="zoning_code",
-                    value=code,
-                    citation_ids=[citation_id],
-                ))
-        
-        # Zoning district/area names
-        district_patterns = [
-            r'(?:downtown|north shore|south shore|city centre|transit.oriented|neighbourhood)\s*(?:plan|area|district|zone)?',
-            r'(?:single.family|multi.family|multi.unit|duplex|triplex|fourplex|townhouse)\s*(?:residential|zone|district)?',
-            r'(?:low|medium|high)\s*density\s*(?:residential|zone|area)?',
-        ]
-        
-        for pattern in district_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                district = match.group(0).strip()
-                if len(district) > 3:
-                    fact_counter += 1
-                    fact_id = f"fact_{region_id}_zoning_district_{fact_counter:04d}"
-                    facts.append(ExtractedFact(
-                        id=fact_id,
-                        region_id=region_id,
-                        fact_type=FactType.ZONING,
-                        key="zoning_district",
-                        value=district,
-                        citation_ids=[citation_id],
-                    ))
-        
-        # Height restrictions (e.g., "12 metres", "4 storeys", "40 feet")
-        height_patterns = [
-            r'(\d+(?:\.\d+)?)\s*(?:metre|meter|m)\s*(?:height|tall|maximum)?',
-            r'(\d+)\s*(?:storey|story|stories|floors?)\s*(?:height|maximum|building)?',
-            r'(?:height|maximum)\s*(?:of|:)?\s*(\d+(?:\.\d+)?)\s*(?:m|metres?|feet|ft)?',
-        ]
-        
-        for pattern in height_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                value = match.group(1) if match.lastindex else match.group(0)
-                fact_counter += 1
-                fact_id = f"fact_{region_id}_zoning_height_{fact_counter:04d}"
-                facts.append(ExtractedFact(
-                    id=fact_id,
-                    region_id=region_id,
-                    fact_type=FactType.ZONING,
-                    key="height_restriction",
-                    value=match.group(0).strip(),
-                    unit="metres" if "metre" in match.group(0).lower() or "m" in match.group(0).lower() else "storeys",
-                    citation_ids=[citation_id],
-                ))
-        
-        # Density/FSR (Floor Space Ratio)
-        density_patterns = [
-            r'(?:fsr|floor\s*space\s*ratio)\s*(?:of|:)?\s*(\d+(?:\.\d+)?)',
-            r'(\d+(?:\.\d+)?)\s*(?:fsr|floor\s*space\s*ratio)',
-            r'density\s*(?:of|:)?\s*(\d+(?:\.\d+)?)\s*(?:units?|dwelling|per)',
-            r'(\d+)\s*(?:units?|dwellings?)\s*per\s*(?:hectare|acre|ha)',
-        ]
-        
-        for pattern in density_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                fact_counter += 1
-                fact_id = f"fact_{region_id}_zoning_density_{fact_counter:04d}"
-                facts.append(ExtractedFact(
-                    id=fact_id,
-                    region_id=region_id,
-                    fact_type=FactType.ZONING,
-                    key="density_regulation",
-                    value=match.group(0).strip(),
-                    citation_ids=[citation_id],
-                ))
-        
-        # Lot coverage percentages
-        coverage_patterns = [
-            r'(?:lot\s*coverage|site\s*coverage|building\s*coverage)\s*(?:of|:)?\s*(\d+(?:\.\d+)?)\s*%?',
-            r'(\d+(?:\.\d+)?)\s*%?\s*(?:lot\s*coverage|site\s*coverage|maximum\s*coverage)',
-        ]
-        
-        for pattern in coverage_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                fact_counter += 1
-                fact_id = f"fact_{region_id}_zoning_coverage_{fact_counter:04d}"
-                facts.append(ExtractedFact(
-                    id=fact_id,
-                    region_id=region_id,
-                    fact_type=FactType.ZONING,
-                    key="lot_coverage",
-                    value=match.group(0).strip(),
-                    unit="percent",
-                    citation_ids=[citation_id],
-                ))
-        
-        # Setback requirements
-        setback_patterns = [
-            r'(?:front|rear|side|setback)\s*(?:yard|setback)?\s*(?:of|:)?\s*(\d+(?:\.\d+)?)\s*(?:m|metres?|feet|ft)?',
-            r'(\d+(?:\.\d+)?)\s*(?:m|metres?|feet|ft)\s*(?:front|rear|side)\s*(?:yard|setback)?',
-        ]
-        
-        for pattern in setback_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                fact_counter += 1
-                fact_id = f"fact_{region_id}_zoning_setback_{fact_counter:04d}"
-                facts.append(ExtractedFact(
-                    id=fact_id,
-                    region_id=region_id,
-                    fact_type=FactType.ZONING,
-                    key="setback_requirement",
-                    value=match.group(0).strip(),
-                    citation_ids=[citation_id],
-                ))
-        
-        # Bylaw numbers
-        bylaw_patterns = [
-            r'(?:bylaw|by-law)\s*(?:no\.?|#)?\s*(\d+)',
-            r'(?:zoning\s*bylaw|land\s*use\s*bylaw)\s*(?:no\.?|#)?\s*(\d+)?',
-        ]
-        
-        for pattern in bylaw_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                fact_counter += 1
-                fact_id = f"fact_{region_id}_zoning_bylaw_{fact_counter:04d}"
-                facts.append(ExtractedFact(
-                    id=fact_id,
-                    region_id=region_id,
-                    fact_type=FactType.ZONING,
-                    key="bylaw_reference",
-                    value=match.group(0).strip(),
-                    citation_ids=[citation_id],
-                ))
-        
-        # Land use keywords with context
-        land_use_keywords = [
-            "residential", "commercial", "industrial", "mixed-use", "mixed use",
-            "agricultural", "institutional", "recreational", "open space",
-            "transit-oriented", "transit oriented", "high density", "low density",
-            "medium density", "multi-family", "single-family", "multi-unit",
-            "small-scale", "small scale", "infill", "intensification",
-        ]
-        
-        seen_keywords = set()
-        for keyword in land_use_keywords:
-            if keyword.lower() in text.lower() and keyword.lower() not in seen_keywords:
-                seen_keywords.add(keyword.lower())
-                fact_counter += 1
-                fact_id = f"fact_{region_id}_zoning_landuse_{fact_counter:04d}"
-                
-                facts.append(ExtractedFact(
-                    id=fact_id,
-                    region_id=region_id,
-                    fact_type=FactType.ZONING,
-                    key="land_use_type",
-                    value=keyword,
-                    citation_ids=[citation_id],
-                ))
-        
-        # Parking requirements
-        parking_patterns = [
-            r'(\d+(?:\.\d+)?)\s*(?:parking\s*)?(?:stalls?|spaces?)\s*(?:per|/)\s*(?:unit|dwelling|sq\.?\s*(?:m|ft|metre|foot))',
-            r'(?:parking|stalls?|spaces?)\s*(?:requirement|required|minimum)\s*(?:of|:)?\s*(\d+(?:\.\d+)?)',
-        ]
-        
-        for pattern in parking_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        if not text:
+            return facts
+        fact_counter = counter_start
+        doc = "c" + citation_id.rsplit("_", 1)[-1]
+        id_prefix = f"fact_{region_id}_{doc}_"
+        
+        # Every union alternative except the district keywords carries a
+        # digit (codes, heights, FSRs, setbacks, bylaw and stall counts),
+        # so a digit-free page skips the scan outright
+        if _INT_PREFIX_RE.search(text) is not None:
+            # One scan of the fused alternation; facts come out in document
+            # order, dispatched on the named group that fired. Bylaws repeat
+            # the same code or "3.0 m setback" dozens of times, so every
+            # category dedupes on its normalized value before emitting.
+            seen = set()
+            for match in _ZONING_UNION.finditer(text):
+                group = match.lastgroup
+                value = match.group(0)
+                if group != "code":
+                    value = value.strip()
+                    if group == "district" and len(value) <= 3:
+                        continue
+                dedup_key = (group, value.lower())
+                if dedup_key in seen:
+                    continue
+                seen.add(dedup_key)
+
+                id_token, key, unit = _ZONING_GROUP_META[group]
+                if group == "height":
+                    lowered = value.lower()
+                    unit = "metres" if "metre" in lowered or "m" in lowered else "storeys"
+
                 fact_counter += 1
-                fact_id = f"fact_{region_id}_zoning_parking_{fact_counter:04d}"
-                facts.append(ExtractedFact(
-                    id=fact_id,
+                facts.append(ExtractedFact.model_construct(
+                    id=id_prefix + f"{id_token}_{fact_counter:04d}",
                     region_id=region_id,
                     fact_type=FactType.ZONING,
-                    key="parking_requirement",
-                    value=match.group(0).strip(),
+                    key=key,
+                    value=value,
+                    unit=unit,
                     citation_ids=[citation_id],
                 ))
-        
+
+        # Land use keywords with context; one lowercase copy serves every
+        # membership test
+        lower_text = text.lower()
+        for keyword in _match_keywords(lower_text, _LAND_USE_KEYWORDS, _LAND_USE_AC):
+            fact_counter += 1
+            fact_id = id_prefix + f"zoning_landuse_{fact_counter:04d}"
+
+            facts.append(ExtractedFact.model_construct(
+                id=fact_id,
+                region_id=region_id,
+                fact_type=FactType.ZONING,
+                key="land_use_type",
+                value=keyword,
+                citation_ids=[citation_id],
+            ))
+
         return facts
     
     def _extract_proposal_facts(
         self,
         text: str,
         region_id: str,
-        citation_id: str
+        citation_id: str,
+        counter_start: int = 0,
+        lower_text: Optional[str] = None,
     ) -> List[ExtractedFact]:
-        """Extract proposal-related facts from text"""
+        """Extract proposal-related facts from text
+
+        counter_start offsets the fact-id counter so page-by-page callers
+        keep ids unique across one document. Callers that already lowered
+        the text (the development-content check) pass it via lower_text
+        to spare a second full-document copy.
+        """
         facts: List[ExtractedFact] = []
-        fact_counter = 0
-        
-        # Application/proposal IDs
-        proposal_patterns = [
-            r'application\s*#?\s*([A-Z0-9-]+)',
-            r'proposal\s*#?\s*([A-Z0-9-]+)',
-            r'DP\s*([A-Z0-9-]+)',  # Development Permit
-            r'DA\s*([A-Z0-9-]+)',  # Development Application
-            r'DVP\s*([A-Z0-9-]+)',  # Development Variance Permit
-            r'REZ\s*([A-Z0-9-]+)',  # Rezoning
-            r'SUB\s*([A-Z0-9-]+)',  # Subdivision
-            r'OCP\s*([A-Z0-9-]+)',  # Official Community Plan amendment
-            r'BP\s*([A-Z0-9-]+)',  # Building Permit
-        ]
-        
-        for pattern in proposal_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                fact_counter += 1
-                fact_id = f"fact_{region_id}_proposal_{fact_counter:04d}"
-                
-                facts.append(ExtractedFact(
-                    id=fact_id,
-                    region_id=region_id,
-                    fact_type=FactType.PROPOSAL,
-                    key="proposal_id",
-                    value=match.group(0).strip(),
-                    citation_ids=[citation_id],
-                ))
-        
+        if not text:
+            return facts
+        fact_counter = counter_start
+        doc = "c" + citation_id.rsplit("_", 1)[-1]
+        id_prefix = f"fact_{region_id}_{doc}_"
+        # One lowercase copy serves the permit/status/project keyword scans
+        if lower_text is None:
+            lower_text = text.lower()
+
+        # One scan of the fused alternation: proposal ids, rates, cost
+        # charges and unit counts in document order, deduped on the
+        # normalized value like the zoning scan
+        seen = set()
+        for match in _PROPOSAL_UNION.finditer(text):
+            group = match.lastgroup
+            value = match.group(0).strip()
+            if group == "units":
+                # Only capture meaningful unit counts (not tiny numbers
+                # from other contexts); every units alternative starts
+                # with the digits
+                if int(_INT_PREFIX_RE.match(value).group(0)) < 2:
+                    continue
+            dedup_key = (group, value.lower())
+            if dedup_key in seen:
+                continue
+            seen.add(dedup_key)
+
+            id_token, key, unit = _PROPOSAL_GROUP_META[group]
+            fact_counter += 1
+            facts.append(ExtractedFact.model_construct(
+                id=id_prefix + f"{id_token}_{fact_counter:04d}",
+                region_id=region_id,
+                fact_type=FactType.PROPOSAL,
+                key=key,
+                value=value,
+                unit=unit,
+                citation_ids=[citation_id],
+            ))
+
         # Development permit types
-        permit_types = [
-            "development permit", "building permit", "variance permit",
-            "rezoning", "subdivision", "sign permit", "demolition permit",
-            "plumbing permit", "electrical permit", "minor variance",
-            "ocp amendment", "community plan amendment",
-        ]
-        
-        seen_permits = set()
-        for permit_type in permit_types:
-            if permit_type.lower() in text.lower() and permit_type.lower() not in seen_permits:
-                seen_permits.add(permit_type.lower())
-                fact_counter += 1
-                fact_id = f"fact_{region_id}_proposal_type_{fact_counter:04d}"
-                
-                facts.append(ExtractedFact(
-                    id=fact_id,
-                    region_id=region_id,
-                    fact_type=FactType.PROPOSAL,
-                    key="permit_type",
-                    value=permit_type,
-                    citation_ids=[citation_id],
-                ))
-        
-        # Development rates/statistics
-        rate_patterns = [
-            r'(\d+)\s*(?:development\s*)?(?:permits?|applications?)\s*(?:issued|approved|submitted|received)',
-            r'(?:issued|approved|submitted|received)\s*(\d+)\s*(?:development\s*)?(?:permits?|applications?)',
-            r'(\d+)\s*(?:new|total)\s*(?:units?|dwellings?|homes?)\s*(?:approved|built|constructed|permitted)',
-            r'(?:approval\s*rate|success\s*rate)\s*(?:of|:)?\s*(\d+(?:\.\d+)?)\s*%',
-            r'(\d+)\s*(?:days?|weeks?|months?)\s*(?:processing|review|approval)\s*(?:time|period)?',
-        ]
-        
-        for pattern in rate_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                fact_counter += 1
-                fact_id = f"fact_{region_id}_proposal_rate_{fact_counter:04d}"
-                
-                facts.append(ExtractedFact(
-                    id=fact_id,
-                    region_id=region_id,
-                    fact_type=FactType.PROPOSAL,
-                    key="development_rate",
-                    value=match.group(0).strip(),
-                    citation_ids=[citation_id],
-                ))
-        
-        # Development cost charges
-        dcc_patterns = [
-            r'(?:development\s*cost\s*charge|dcc)\s*(?:of|:)?\s*\$?([\d,]+(?:\.\d+)?)',
-            r'\$?([\d,]+(?:\.\d+)?)\s*(?:per\s*)?(?:development\s*cost\s*charge|dcc)',
-            r'(?:amenity\s*contribution|community\s*amenity)\s*(?:of|:)?\s*\$?([\d,]+(?:\.\d+)?)',
-        ]
-        
-        for pattern in dcc_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                fact_counter += 1
-                fact_id = f"fact_{region_id}_proposal_dcc_{fact_counter:04d}"
-                
-                facts.append(ExtractedFact(
-                    id=fact_id,
-                    region_id=region_id,
-                    fact_type=FactType.PROPOSAL,
-                    key="development_cost_charge",
-                    value=match.group(0).strip(),
-                    unit="CAD",
-                    citation_ids=[citation_id],
-                ))
-        
+        for permit_type in _match_keywords(lower_text, _PERMIT_TYPES, _PERMIT_AC):
+            fact_counter += 1
+            fact_id = id_prefix + f"proposal_type_{fact_counter:04d}"
+
+            facts.append(ExtractedFact.model_construct(
+                id=fact_id,
+                region_id=region_id,
+                fact_type=FactType.PROPOSAL,
+                key="permit_type",
+                value=permit_type,
+                citation_ids=[citation_id],
+            ))
+
         # Status keywords
-        status_keywords = ["approved", "pending", "under review", "rejected", "withdrawn", 
-                          "in progress", "complete", "conditional approval"]
-        seen_statuses = set()
-        for keyword in status_keywords:
-            if keyword.lower() in text.lower() and keyword.lower() not in seen_statuses:
-                seen_statuses.add(keyword.lower())
-                fact_counter += 1
-                fact_id = f"fact_{region_id}_proposal_status_{fact_counter:04d}"
-                
-                facts.append(ExtractedFact(
-                    id=fact_id,
-                    region_id=region_id,
-                    fact_type=FactType.PROPOSAL,
-                    key="proposal_status",
-                    value=keyword,
-                    citation_ids=[citation_id],
-                ))
+        for keyword in _match_keywords(lower_text, _STATUS_KEYWORDS, _STATUS_AC):
+            fact_counter += 1
+            fact_id = id_prefix + f"proposal_status_{fact_counter:04d}"
+
+            facts.append(ExtractedFact.model_construct(
+                id=fact_id,
+                region_id=region_id,
+                fact_type=FactType.PROPOSAL,
+                key="proposal_status",
+                value=keyword,
+                citation_ids=[citation_id],
+            ))
         
         # Project types/categories
-        project_types = [
-            "multi-family", "multi family", "single-family", "single family",
-            "townhouse", "apartment", "condo", "condominium", "mixed-use",
-            "commercial", "retail", "office", "industrial", "warehouse",
-            "affordable housing", "rental housing", "seniors housing",
-        ]
-        
-        seen_projects = set()
-        for project_type in project_types:
-            if project_type.lower() in text.lower() and project_type.lower() not in seen_projects:
-                seen_projects.add(project_type.lower())
-                fact_counter += 1
-                fact_id = f"fact_{region_id}_proposal_project_{fact_counter:04d}"
-                
-                facts.append(ExtractedFact(
-                    id=fact_id,
-                    region_id=region_id,
-                    fact_type=FactType.PROPOSAL,
-                    key="project_type",
-                    value=project_type,
-                    citation_ids=[citation_id],
-                ))
-        
-        # Unit counts
-        unit_patterns = [
-            r'(\d+)\s*(?:residential\s*)?(?:units?|dwellings?|suites?|apartments?)',
-            r'(\d+)\s*(?:bed|bedroom)\s*(?:units?|apartments?)?',
-            r'(\d+)\s*(?:storeys?|stories?|floors?)\s*(?:building|tower|development)?',
-        ]
-        
-        for pattern in unit_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                value = match.group(1)
-                # Only capture meaningful unit counts (not tiny numbers from other contexts)
-                if int(value) >= 2:
-                    fact_counter += 1
-                    fact_id = f"fact_{region_id}_proposal_units_{fact_counter:04d}"
-                    
-                    facts.append(ExtractedFact(
-                        id=fact_id,
-                        region_id=region_id,
-                        fact_type=FactType.PROPOSAL,
-                        key="unit_count",
-                        value=match.group(0).strip(),
-                        citation_ids=[citation_id],
-                    ))
-        
+        for project_type in _match_keywords(lower_text, _PROJECT_TYPES, _PROJECT_AC):
+            fact_counter += 1
+            fact_id = id_prefix + f"proposal_project_{fact_counter:04d}"
+
+            facts.append(ExtractedFact.model_construct(
+                id=fact_id,
+                region_id=region_id,
+                fact_type=FactType.PROPOSAL,
+                key="project_type",
+                value=project_type,
+                citation_ids=[citation_id],
+            ))
+
         return facts
     
     def _extract_demographic_facts(
         self,
         text: str,
         region_id: str,
-        citation_id: str
+        citation_id: str,
+        counter_start: int = 0
     ) -> List[ExtractedFact]:
-        """Extract demographic/analytics facts from text"""
+        """Extract demographic/analytics facts from text
+
+        counter_start offsets the fact-id counter so page-by-page callers
+        keep ids unique across one document.
+        """
         facts: List[ExtractedFact] = []
-        fact_counter = 0
-        
-        population_patterns = [
-            r'population\s*:?\s*([\d,]+)',
-            r'([\d,]+)\s*residents',
-            r'([\d,]+)\s*people',
-        ]
-        
-        for pattern in population_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        if not text:
+            return facts
+        fact_counter = counter_start
+        doc = "c" + citation_id.rsplit("_", 1)[-1]
+        id_prefix = f"fact_{region_id}_{doc}_"
+        
+        # findall hands back the captured number strings directly (each
+        # pattern has exactly one group), skipping a Match object per hit
+        for pattern in _POPULATION_RES:
+            for value_str in pattern.findall(text):
                 fact_counter += 1
-                fact_id = f"fact_{region_id}_demographic_{fact_counter:04d}"
-                
-                value_str = match.group(1) if match.lastindex else match.group(0)
-                value = int(re.sub(r'[,\s]', '', value_str))
-                
-                facts.append(ExtractedFact(
+                fact_id = id_prefix + f"demographic_{fact_counter:04d}"
+
+                value = int(_NUM_SEP_RE.sub('', value_str))
+
+                facts.append(ExtractedFact.model_construct(
                     id=fact_id,
                     region_id=region_id,
                     fact_type=FactType.DEMOGRAPHIC,
@@ -633,18 +835,16 @@ class FactExtractor:
                     citation_ids=[citation_id],
                 ))
         
-        growth_pattern = r'growth\s*(?:rate|of)?\s*:?\s*([\d.]+)%'
-        matches = re.finditer(growth_pattern, text, re.IGNORECASE)
-        for match in matches:
+        for rate_str in _GROWTH_RE.findall(text):
             fact_counter += 1
-            fact_id = f"fact_{region_id}_demographic_growth_{fact_counter:04d}"
-            
-            facts.append(ExtractedFact(
+            fact_id = id_prefix + f"demographic_growth_{fact_counter:04d}"
+
+            facts.append(ExtractedFact.model_construct(
                 id=fact_id,
                 region_id=region_id,
                 fact_type=FactType.DEMOGRAPHIC,
                 key="growth_rate",
-                value=float(match.group(1)),
+                value=float(rate_str),
                 unit="percent",
                 citation_ids=[citation_id],
             ))
@@ -652,23 +852,24 @@ class FactExtractor:
         return facts
     
     def _parse_budget_value(self, value_str: str) -> Optional[float]:
-        """Parse a budget value string to a float"""
-        normalized = value_str.replace("$", "").replace(",", "").strip()
-        
-        if "billion" in value_str.lower() or "b" in value_str.lower():
-            multiplier = 1_000_000_000
-            normalized = normalized.replace("billion", "").replace("b", "").strip()
-        elif "million" in value_str.lower() or "m" in value_str.lower():
-            multiplier = 1_000_000
-            normalized = normalized.replace("million", "").replace("m", "").strip()
-        elif "thousand" in value_str.lower() or "k" in value_str.lower():
-            multiplier = 1_000
-            normalized = normalized.replace("thousand", "").replace("k", "").strip()
-        else:
-            multiplier = 1
-        
+        """Parse a budget value string to a float
+
+        One lowercase, one table scan for the suffix, one regex pull of
+        the numeric part; the old version lowercased the string up to six
+        times and rebuilt it with chained replace() calls.
+        """
+        lowered = value_str.lower()
+        multiplier = 1
+        for suffix, mult in _BUDGET_MULTIPLIERS:
+            if suffix in lowered:
+                multiplier = mult
+                break
+
+        number = _NUM_RE.search(value_str)
+        if number is None:
+            return None
         try:
-            return float(normalized) * multiplier
+            return float(number.group(0).replace(",", "")) * multiplier
         except ValueError:
             return None
     
@@ -679,36 +880,46 @@ class FactExtractor:
         citation_id: str,
         file_path: Path
     ) -> List[ExtractedFact]:
-        """Extract facts from RSS feed"""
+        """Extract facts from RSS feed
+
+        Parsed straight with lxml.etree instead of through the bs4
+        wrapper, which built a second Python tree on top of lxml's just
+        to call get_text(). Item entries stream through iter/islice and
+        counter offsets keep fact ids unique across entries.
+        """
         facts: List[ExtractedFact] = []
-        
+
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            # RSS feeds are XML, try to parse as such
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(content, "xml")
-            
-            for entry in soup.find_all("item")[:10]:  # Limit entries
-                title = entry.find("title")
-                description = entry.find("description")
-                
+            from lxml import etree
+            # RSS feeds are XML; recover=True tolerates the malformed
+            # feeds bs4 used to paper over
+            root = etree.fromstring(
+                file_path.read_bytes(),
+                parser=etree.XMLParser(recover=True, resolve_entities=False),
+            )
+            extract = self._by_category.get(source.category)
+            if root is None or extract is None:
+                return facts
+
+            offset = 0
+            for entry in islice(root.iter("item"), 10):  # Limit entries
+                title = entry.findtext("title")
+                description = entry.findtext("description")
+
                 text = ""
                 if title:
-                    text += title.get_text() + " "
+                    text += title + " "
                 if description:
-                    text += description.get_text()
-                
-                if source.category == SourceCategory.BUDGET:
-                    facts.extend(self._extract_budget_facts(text, region_id, citation_id))
-                elif source.category == SourceCategory.ZONING:
-                    facts.extend(self._extract_zoning_facts(text, region_id, citation_id))
-                elif source.category == SourceCategory.PROPOSALS:
-                    facts.extend(self._extract_proposal_facts(text, region_id, citation_id))
-                elif source.category == SourceCategory.ANALYTICS:
-                    facts.extend(self._extract_demographic_facts(text, region_id, citation_id))
-        except Exception as e:
-            print(f"Error reading RSS {file_path}: {e}")
-        
+                    text += description
+
+                entry_facts = extract(
+                    text, region_id, citation_id, counter_start=offset
+                )
+                offset += len(entry_facts)
+                facts.extend(entry_facts)
+        except Exception:
+            logger.exception("Error reading RSS %s", file_path)
+
         return facts
     
     def _extract_from_api(
@@ -718,30 +929,74 @@ class FactExtractor:
         citation_id: str,
         file_path: Path
     ) -> List[ExtractedFact]:
-        """Extract facts from API/JSON response"""
+        """Extract facts from API/JSON response
+
+        The regex extractors run over the payload's keys and string
+        leaves joined by newlines rather than a pretty-printed re-dump
+        of the whole document; numeric fields are covered by the
+        structured *_from_json extractors below.
+        """
         facts: List[ExtractedFact] = []
         
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            data = json.loads(content)
+            data = _json_loads(file_path.read_bytes())
             
-            text = json.dumps(data, indent=2)
+            text = "\n".join(self._iter_json_strings(data))
             
+            extract = self._by_category.get(source.category)
+            if extract:
+                facts.extend(extract(text, region_id, citation_id))
             if source.category == SourceCategory.BUDGET:
-                facts.extend(self._extract_budget_facts(text, region_id, citation_id))
                 facts.extend(self._extract_budget_facts_from_json(data, region_id, citation_id))
-            elif source.category == SourceCategory.ZONING:
-                facts.extend(self._extract_zoning_facts(text, region_id, citation_id))
-            elif source.category == SourceCategory.PROPOSALS:
-                facts.extend(self._extract_proposal_facts(text, region_id, citation_id))
             elif source.category == SourceCategory.ANALYTICS:
-                facts.extend(self._extract_demographic_facts(text, region_id, citation_id))
                 facts.extend(self._extract_demographic_facts_from_json(data, region_id, citation_id))
-        except Exception as e:
-            print(f"Error reading API JSON {file_path}: {e}")
+        except Exception:
+            logger.exception("Error reading API JSON %s", file_path)
         
         return facts
-    
+
+    @staticmethod
+    def _iter_json_strings(obj):
+        """Yield every key and string leaf of a parsed JSON document"""
+        if isinstance(obj, str):
+            yield obj
+        elif isinstance(obj, dict):
+            for key, value in obj.items():
+                yield key
+                yield from FactExtractor._iter_json_strings(value)
+        elif isinstance(obj, list):
+            for value in obj:
+                yield from FactExtractor._iter_json_strings(value)
+
+    @staticmethod
+    def _iter_numeric_by_key(data: Any, key_re: re.Pattern) -> Any:
+        """Yield (dotted_key, key_lower, value) for numeric values under keys
+
+        Walks the document with an explicit stack instead of recursion:
+        no Python frame per node, and arbitrarily deep JSON cannot hit
+        the recursion limit. A dict's matching numeric values are
+        yielded before its subtrees are descended.
+        """
+        stack = [(data, "")]
+        while stack:
+            node, path = stack.pop()
+            if isinstance(node, dict):
+                children = []
+                for key, value in node.items():
+                    key_lower = key.lower()
+                    child_path = f"{path}.{key}" if path else key
+                    if key_re.search(key_lower):
+                        if isinstance(value, (int, float)):
+                            yield child_path, key_lower, value
+                        elif isinstance(value, dict):
+                            children.append((value, child_path))
+                    else:
+                        children.append((value, child_path))
+                stack.extend(reversed(children))
+            elif isinstance(node, list):
+                for item in reversed(node):
+                    stack.append((item, path))
+
     def _extract_budget_facts_from_json(
         self,
         data: dict,
@@ -751,36 +1006,21 @@ class FactExtractor:
         """Extract budget facts from structured JSON"""
         facts: List[ExtractedFact] = []
         fact_counter = 0
-        
-        budget_keys = ["budget", "total", "amount", "funding", "allocation", "spending"]
-        
-        def extract_from_dict(d, path=""):
-            nonlocal fact_counter
-            if isinstance(d, dict):
-                for key, value in d.items():
-                    key_lower = key.lower()
-                    if any(bk in key_lower for bk in budget_keys):
-                        if isinstance(value, (int, float)):
-                            fact_counter += 1
-                            fact_id = f"fact_{region_id}_budget_json_{fact_counter:04d}"
-                            facts.append(ExtractedFact(
-                                id=fact_id,
-                                region_id=region_id,
-                                fact_type=FactType.BUDGET,
-                                key=f"{path}.{key}" if path else key,
-                                value=value,
-                                unit="CAD",
-                                citation_ids=[citation_id],
-                            ))
-                        elif isinstance(value, dict):
-                            extract_from_dict(value, f"{path}.{key}" if path else key)
-                    else:
-                        extract_from_dict(value, f"{path}.{key}" if path else key)
-            elif isinstance(d, list):
-                for item in d:
-                    extract_from_dict(item, path)
-        
-        extract_from_dict(data)
+        doc = "c" + citation_id.rsplit("_", 1)[-1]
+        id_prefix = f"fact_{region_id}_{doc}_"
+
+        for key, _, value in self._iter_numeric_by_key(data, _BUDGET_JSON_KEY_RE):
+            fact_counter += 1
+            fact_id = id_prefix + f"budget_json_{fact_counter:04d}"
+            facts.append(ExtractedFact.model_construct(
+                id=fact_id,
+                region_id=region_id,
+                fact_type=FactType.BUDGET,
+                key=key,
+                value=value,
+                unit="CAD",
+                citation_ids=[citation_id],
+            ))
         return facts
     
     def _extract_demographic_facts_from_json(
@@ -792,35 +1032,35 @@ class FactExtractor:
         """Extract demographic facts from structured JSON"""
         facts: List[ExtractedFact] = []
         fact_counter = 0
-        
-        demo_keys = ["population", "demographics", "growth", "residents", "people", "count"]
-        
-        def extract_from_dict(d, path=""):
-            nonlocal fact_counter
-            if isinstance(d, dict):
-                for key, value in d.items():
-                    key_lower = key.lower()
-                    if any(dk in key_lower for dk in demo_keys):
-                        if isinstance(value, (int, float)):
-                            fact_counter += 1
-                            fact_id = f"fact_{region_id}_demographic_json_{fact_counter:04d}"
-                            unit = "percent" if "rate" in key_lower or "growth" in key_lower else "people"
-                            facts.append(ExtractedFact(
-                                id=fact_id,
-                                region_id=region_id,
-                                fact_type=FactType.DEMOGRAPHIC,
-                                key=f"{path}.{key}" if path else key,
-                                value=value,
-                                unit=unit,
-                                citation_ids=[citation_id],
-                            ))
-                        elif isinstance(value, dict):
-                            extract_from_dict(value, f"{path}.{key}" if path else key)
-                    else:
-                        extract_from_dict(value, f"{path}.{key}" if path else key)
-            elif isinstance(d, list):
-                for item in d:
-                    extract_from_dict(item, path)
-        
-        extract_from_dict(data)
-        return facts
\ No newline at end of file
+        doc = "c" + citation_id.rsplit("_", 1)[-1]
+        id_prefix = f"fact_{region_id}_{doc}_"
+
+        for key, key_lower, value in self._iter_numeric_by_key(data, _DEMO_JSON_KEY_RE):
+            fact_counter += 1
+            fact_id = id_prefix + f"demographic_json_{fact_counter:04d}"
+            unit = "percent" if "rate" in key_lower or "growth" in key_lower else "people"
+            facts.append(ExtractedFact.model_construct(
+                id=fact_id,
+                region_id=region_id,
+                fact_type=FactType.DEMOGRAPHIC,
+                key=key,
+                value=value,
+                unit=unit,
+                citation_ids=[citation_id],
+            ))
+        return facts
+
+def _extract_source_facts(
+    source: DiscoveredSource,
+    region_id: str,
+    citation_id: str,
+    settings: Settings,
+) -> List[ExtractedFact]:
+    """Process-pool entry point for one source's extraction
+
+    Module-level so it pickles by name; each worker builds its own
+    FactExtractor (cheap: a dispatch-table dict) since the parent's
+    instance cannot cross the process boundary.
+    """
+    extractor = FactExtractor(settings)
+    return extractor._extract_from_source(source, region_id, citation_id)
@@ -8,6 +8,7 @@ from backend.storage.source_registry import SourceRegistry
 from backend.storage.supabase_storage import get_supabase_storage
 from backend.extractors.fact_extractor import FactExtractor
 from backend.agents.budget_analyst import BudgetAnalyst
+from backend.agents.fact_partition import partition_facts
 from backend.agents.policy_analyst import PolicyAnalyst
 from backend.agents.underwriter import Underwriter
 from backend.models.discovered_source import SourceCategory
@@ -72,12 +73,14 @@ class PipelineRunner:
             output = run_production_crew(facts, citations, self.settings, region_id)
             return output
         else:
-            # Deterministic mode - run agents individually
+            # Deterministic mode - run agents individually over one shared partition
+            fact_parts = partition_facts(facts)
+
             print(f"[Pipeline] Running Budget Analyst...")
-            budget_output = self.budget_analyst.analyze(facts, citations)
-            
+            budget_output = self.budget_analyst.analyze_partitioned(fact_parts, citations)
+
             print(f"[Pipeline] Running Policy Analyst...")
-            policy_output = self.policy_analyst.analyze(facts, citations)
+            policy_output = self.policy_analyst.analyze_partitioned(fact_parts, citations)
             
             print(f"[Pipeline] Running Underwriter...")
             underwriter_output = self.underwriter.analyze(
@@ -87,8 +90,9 @@ class PipelineRunner:
                 citations
             )
         
-        # Step 5: Compile final output
-        output = RegionPanelOutput(
+        # Step 5: Compile final output. model_construct skips pydantic
+        # validation: every field is an already-validated internal model
+        output = RegionPanelOutput.model_construct(
             region_id=region_id,
             budget_analysis=budget_output,
             policy_analysis=policy_output,
@@ -133,8 +137,9 @@ class PipelineRunner:
             return run_production_crew(facts, citations, self.settings, region_id)
         else:
             # Deterministic mode
-            budget_output = self.budget_analyst.analyze(facts, citations)
-            policy_output = self.policy_analyst.analyze(facts, citations)
+            fact_parts = partition_facts(facts)
+            budget_output = self.budget_analyst.analyze_partitioned(fact_parts, citations)
+            policy_output = self.policy_analyst.analyze_partitioned(fact_parts, citations)
             underwriter_output = self.underwriter.analyze(
                 budget_output,
                 policy_output,
@@ -142,7 +147,7 @@ class PipelineRunner:
                 citations
             )
         
-        output = RegionPanelOutput(
+        output = RegionPanelOutput.model_construct(
             region_id=region_id,
             budget_analysis=budget_output,
             policy_analysis=policy_output,
@@ -17,6 +17,20 @@ try:
 except ImportError:
     FEEDPARSER_AVAILABLE = False
 
+# Compiled once at import, like the fact extractor's patterns. The link
+# checks only need a yes/no, so each former pattern list is one
+# alternation: a single engine invocation per href instead of one per
+# pattern with a regex-cache probe each.
+_ARCGIS_LINK_RE = re.compile(
+    r'arcgis\.com|arcgis.*map|arcgis.*zoning|geoportal', re.IGNORECASE
+)
+_API_LINK_RE = re.compile(
+    r'/api/|api\.|\.json|endpoint|json$', re.IGNORECASE
+)
+_SCRIPT_API_URL_RE = re.compile(
+    r'["\'](https?://[^"\']*api[^"\']*)["\']', re.IGNORECASE
+)
+
 
 class SourceDiscovery:
     """Discovers sources from city websites"""
@@ -291,21 +305,13 @@ class SourceDiscovery:
         if category != SourceCategory.ZONING:
             return sources
         
-        # Look for ArcGIS portal links
-        arcgis_patterns = [
-            r'arcgis\.com',
-            r'arcgis.*map',
-            r'arcgis.*zoning',
-            r'geoportal',
-        ]
-        
         # Check all links
         for link in soup.find_all("a", href=True):
             href = link.get("href", "")
             href_lower = href.lower()
             
             # Check if it matches ArcGIS patterns
-            if any(re.search(pattern, href_lower, re.IGNORECASE) for pattern in arcgis_patterns):
+            if _ARCGIS_LINK_RE.search(href_lower):
                 full_url = urljoin(current_url, href)
                 
                 if full_url not in self.visited_urls:
@@ -384,19 +390,11 @@ class SourceDiscovery:
         sources: List[DiscoveredSource] = []
         
         # Look for links to API endpoints
-        api_patterns = [
-            r'/api/',
-            r'api\.',
-            r'\.json',
-            r'endpoint',
-            r'json$',
-        ]
-        
         for link in soup.find_all("a", href=True):
             href = link.get("href", "")
             href_lower = href.lower()
             
-            if any(re.search(pattern, href_lower, re.IGNORECASE) for pattern in api_patterns):
+            if _API_LINK_RE.search(href_lower):
                 full_url = urljoin(current_url, href)
                 
                 if full_url not in self.visited_urls:
@@ -413,7 +411,7 @@ class SourceDiscovery:
         for script in soup.find_all("script"):
             script_text = script.string or ""
             # Look for API URLs in JavaScript
-            api_urls = re.findall(r'["\'](https?://[^"\']*api[^"\']*)["\']', script_text, re.IGNORECASE)
+            api_urls = _SCRIPT_API_URL_RE.findall(script_text)
             for api_url in api_urls:
                 if api_url not in self.visited_urls:
                     source = DiscoveredSource(
@@ -1,6 +1,7 @@
 """Storage module for source registry and fact storage"""
 
 from .source_registry import SourceRegistry
+from .response_cache import ResponseCache
 from .supabase_storage import SupabaseStorage, get_supabase_storage
 
-__all__ = ["SourceRegistry", "SupabaseStorage", "get_supabase_storage"]
+__all__ = ["SourceRegistry", "ResponseCache", "SupabaseStorage", "get_supabase_storage"]
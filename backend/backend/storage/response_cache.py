@@ -0,0 +1,60 @@
+"""Disk-backed cache of full region panel outputs"""
+import json
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from backend.config import Settings
+
+
+class ResponseCache:
+    """Caches serialized panel outputs keyed by a content hash
+
+    A repeat run over identical facts and citations (retries, A/B
+    comparisons, re-renders) returns the stored JSON instead of paying
+    the full LLM token cost again. Entries survive process restarts via
+    a single JSON file under the data directory.
+    """
+
+    def __init__(self, settings: Settings):
+        self.cache_path = Path(settings.response_cache_path)
+        self.ttl_seconds = settings.response_cache_ttl_seconds
+        self._entries: Optional[Dict[str, dict]] = None
+
+    def _load(self) -> Dict[str, dict]:
+        """Read the cache file once per process, tolerating a missing or
+        corrupt file"""
+        if self._entries is None:
+            try:
+                with open(self.cache_path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached output JSON for a key, honoring the TTL"""
+        entry = self._load().get(key)
+        if entry is None:
+            return None
+        if (
+            self.ttl_seconds is not None
+            and time.time() - entry["cached_at"] > self.ttl_seconds
+        ):
+            self._entries.pop(key, None)
+            return None
+        return entry["output"]
+
+    def put(self, key: str, output_json: str) -> None:
+        """Store an output JSON under its key and persist to disk"""
+        entries = self._load()
+        entries[key] = {"output": output_json, "cached_at": time.time()}
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+
+    def clear(self) -> None:
+        """Drop all entries, in memory and on disk"""
+        self._entries = {}
+        if self.cache_path.exists():
+            self.cache_path.unlink()
@@ -3,7 +3,7 @@ import json
 import sys
 from pathlib import Path
 
-from backend.config import Settings
+from backend.config import get_settings
 from backend.pipeline.runner import PipelineRunner
 from backend.models.discovered_source import SourceCategory
 
@@ -76,7 +76,7 @@ def main():
             SourceCategory.ANALYTICS: ["/statistics", "/demographics"],
         }
     
-    settings = Settings()
+    settings = get_settings()
     runner = PipelineRunner(settings)
     
     try:
@@ -50,3 +50,25 @@ def test_source_registry_get_by_category(test_settings):
     budget_sources = registry.get_sources_by_category("budget")
     assert len(budget_sources) > 0
     assert all(s.category == SourceCategory.BUDGET for s in budget_sources)
+
+
+def test_response_cache_roundtrip(tmp_path):
+    """Test response cache stores, returns, and expires entries"""
+    from backend.config import Settings
+    from backend.storage.response_cache import ResponseCache
+
+    settings = Settings(response_cache_path=str(tmp_path / "cache.json"))
+    cache = ResponseCache(settings)
+
+    assert cache.get("key") is None
+    cache.put("key", '{"region_id": "test"}')
+    assert cache.get("key") == '{"region_id": "test"}'
+
+    # A fresh instance reads the persisted file
+    assert ResponseCache(settings).get("key") == '{"region_id": "test"}'
+
+    expiring = ResponseCache(Settings(
+        response_cache_path=str(tmp_path / "cache.json"),
+        response_cache_ttl_seconds=0,
+    ))
+    assert expiring.get("key") is None